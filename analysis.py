@@ -12,21 +12,24 @@ def extract_log_log_equation(log_x, log_y):
     slope, intercept = np.polyfit(log_x, log_y, 1)
     return slope, intercept
 
-def plot_runtime_vs_metric(sizes, metric_values, karp_runtimes, dinic_runtimes, metric_name):
+def plot_runtime_vs_metric(sizes, metric_values, karp_runtimes, dinic_runtimes, push_relabel_runtimes, metric_name):
     # replace non positive values with a small value to avoid log(0)
     metric_values = np.array(metric_values)
     karp_runtimes = np.array(karp_runtimes)
     dinic_runtimes = np.array(dinic_runtimes)
+    push_relabel_runtimes = np.array(push_relabel_runtimes)
 
     # Avoid taking log of zero or negative values by replacing them with small values
     metric_values = np.where(metric_values <= 0, 1e-10, metric_values)
     karp_runtimes = np.where(karp_runtimes <= 0, 1e-10, karp_runtimes)
     dinic_runtimes = np.where(dinic_runtimes <= 0, 1e-10, dinic_runtimes)
+    push_relabel_runtimes = np.where(push_relabel_runtimes <= 0, 1e-10, push_relabel_runtimes)
 
     # Regular plot
     plt.figure(figsize=(10, 6))
     plt.plot(metric_values, karp_runtimes, label="Edmonds-Karp Runtime", marker='o', color='b')
     plt.plot(metric_values, dinic_runtimes, label="Dinic Runtime", marker='x', color='r')
+    plt.plot(metric_values, push_relabel_runtimes, label="Push-Relabel Runtime", marker='s', color='g')
     plt.xlabel(metric_name)
     plt.ylabel("Runtime (seconds)")
     plt.title(f"Runtime vs {metric_name}")
@@ -39,6 +42,7 @@ def plot_runtime_vs_metric(sizes, metric_values, karp_runtimes, dinic_runtimes,
     log_metric = np.log(metric_values)
     log_karp = np.log(karp_runtimes)
     log_dinic = np.log(dinic_runtimes)
+    log_push_relabel = np.log(push_relabel_runtimes)
 
     plt.scatter(log_metric, log_karp, label="Log Edmonds-Karp", color='b', alpha=0.7)
     slope_karp, intercept_karp = extract_log_log_equation(log_metric, log_karp)
@@ -50,6 +54,11 @@ def plot_runtime_vs_metric(sizes, metric_values, karp_runtimes, dinic_runtimes,
     if not np.isnan(slope_dinic):
         plt.plot(log_metric, np.poly1d([slope_dinic, intercept_dinic])(log_metric), color='r', linestyle='--')
 
+    plt.scatter(log_metric, log_push_relabel, label="Log Push-Relabel", color='g', alpha=0.7)
+    slope_push_relabel, intercept_push_relabel = extract_log_log_equation(log_metric, log_push_relabel)
+    if not np.isnan(slope_push_relabel):
+        plt.plot(log_metric, np.poly1d([slope_push_relabel, intercept_push_relabel])(log_metric), color='g', linestyle='--')
+
     plt.xlabel(f"Log({metric_name})")
     plt.ylabel("Log(Runtime)")
     plt.title(f"Log-Log Plot: Runtime vs {metric_name}")
@@ -59,6 +68,7 @@ def plot_runtime_vs_metric(sizes, metric_values, karp_runtimes, dinic_runtimes,
     # Print the linear equations
     print(f"Edmonds-Karp equation: log(runtime) = {intercept_karp:.2f} + {slope_karp:.2f} * log({metric_name})")
     print(f"Dinic equation: log(runtime) = {intercept_dinic:.2f} + {slope_dinic:.2f} * log({metric_name})")
+    print(f"Push-Relabel equation: log(runtime) = {intercept_push_relabel:.2f} + {slope_push_relabel:.2f} * log({metric_name})")
 
     plt.show()
 
@@ -67,6 +77,7 @@ def measure_runtime_vs_maxflow():
     maxflow_E_values = []
     karp_runtimes = []
     dinic_runtimes = []
+    push_relabel_runtimes = []
 
     for size in [10, 100, 1000, 10000, 20000, 30000]:
         g = Graph.generate_random_graph(size, size * 2, 10)
@@ -82,8 +93,10 @@ def measure_runtime_vs_maxflow():
         karp_time, karp_flow = measure_time(g.edmonds_karp)
         g.reset_calculated_flows()
         dinic_time, dinic_flow = measure_time(g.dinic)
+        g.reset_calculated_flows()
+        push_relabel_time, push_relabel_flow = measure_time(g.push_relabel)
 
-        assert karp_flow == dinic_flow
+        assert karp_flow == dinic_flow == push_relabel_flow
 
         E = size * 2
         maxflow_E = size * E * E
@@ -91,10 +104,11 @@ def measure_runtime_vs_maxflow():
         maxflow_E_values.append(maxflow_E)
         karp_runtimes.append(karp_time)
         dinic_runtimes.append(dinic_time)
+        push_relabel_runtimes.append(push_relabel_time)
 
-        print(f"Size: {size}, Max Flow: {karp_flow}, Karp Time: {karp_time:.6f} s, Dinic Time: {dinic_time:.6f} s")
+        print(f"Size: {size}, Max Flow: {karp_flow}, Karp Time: {karp_time:.6f} s, Dinic Time: {dinic_time:.6f} s, Push-Relabel Time: {push_relabel_time:.6f} s")
 
-    plot_runtime_vs_metric(sizes, maxflow_E_values, karp_runtimes, dinic_runtimes, "V * E^2")
+    plot_runtime_vs_metric(sizes, maxflow_E_values, karp_runtimes, dinic_runtimes, push_relabel_runtimes, "V * E^2")
 
 
 def measure_runtime_vs_maxflow_second():
@@ -102,6 +116,7 @@ def measure_runtime_vs_maxflow_second():
     maxflow_E_values = []
     karp_runtimes = []
     dinic_runtimes = []
+    push_relabel_runtimes = []
 
     for size in [10, 100, 1000, 10000, 20000, 30000]:
         g = Graph.generate_random_graph(size, size * 2, 10)
@@ -117,8 +132,10 @@ def measure_runtime_vs_maxflow_second():
         karp_time, karp_flow = measure_time(g.edmonds_karp)
         g.reset_calculated_flows()
         dinic_time, dinic_flow = measure_time(g.dinic)
+        g.reset_calculated_flows()
+        push_relabel_time, push_relabel_flow = measure_time(g.push_relabel)
 
-        assert karp_flow == dinic_flow
+        assert karp_flow == dinic_flow == push_relabel_flow
 
         E = size * 2
         maxflow_E = (size ** 2) * E
@@ -126,11 +143,35 @@ def measure_runtime_vs_maxflow_second():
         maxflow_E_values.append(maxflow_E)
         karp_runtimes.append(karp_time)
         dinic_runtimes.append(dinic_time)
+        push_relabel_runtimes.append(push_relabel_time)
+
+        print(f"Size: {size}, Max Flow: {karp_flow}, Karp Time: {karp_time:.6f} s, Dinic Time: {dinic_time:.6f} s, Push-Relabel Time: {push_relabel_time:.6f} s")
+
+    plot_runtime_vs_metric(sizes, maxflow_E_values, karp_runtimes, dinic_runtimes, push_relabel_runtimes, "V^2 * E")
+
 
-        print(f"Size: {size}, Max Flow: {karp_flow}, Karp Time: {karp_time:.6f} s, Dinic Time: {dinic_time:.6f} s")
+def measure_capacity_scaling():
+    # Capacities from 1 to 10^6: the scaling variants skip the tiny augmentations
+    solvers = ["edmonds_karp", "edmonds_karp_scaling", "dinic", "dinic_scaling", "push_relabel"]
+
+    for size in [100, 1000, 5000]:
+        g = Graph.generate_random_graph(size, size * 2, 10 ** 6, seed=size)
+        source = next(iter(g.nodes.values()))
+        sink = next(reversed(g.nodes.values()))
+
+        times = {}
+        flows = set()
+        for solver in solvers:
+            g.reset_calculated_flows()
+            start_time = time.time()
+            flows.add(getattr(g, solver)(source, sink))
+            times[solver] = time.time() - start_time
 
-    plot_runtime_vs_metric(sizes, maxflow_E_values, karp_runtimes, dinic_runtimes, "V^2 * E")
+        assert len(flows) == 1
+        print(f"Size: {size}, Max Flow: {flows.pop()}, " + ", ".join(f"{solver}: {times[solver]:.6f} s" for solver in solvers))
 
 
-measure_runtime_vs_maxflow()
-measure_runtime_vs_maxflow_second()
+if __name__ == "__main__":
+    measure_runtime_vs_maxflow()
+    measure_runtime_vs_maxflow_second()
+    measure_capacity_scaling()
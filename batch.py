@@ -0,0 +1,92 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+import math
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    from .graph import Graph, Node, SOLVERS
+    from .csr import CSRGraph
+except ImportError:  # imported as a top-level script module
+    from graph import Graph, Node, SOLVERS
+    from csr import CSRGraph
+
+# One max-flow job: (graph, source, sink, solver name from SOLVERS)
+Job = Tuple[Graph, Node, Node, str]
+
+
+class BatchResult:
+    def __init__(self, max_flow: float, seconds: float) -> None:
+        self.max_flow = max_flow
+        self.seconds = seconds  # Solver time inside the worker, excluding setup
+
+    def __repr__(self): return f"BatchResult({self.max_flow} in {self.seconds:.6f}s)"
+
+
+# Solvers CSRGraph implements itself; the others need the Node/Edge objects rebuilt
+ARRAY_SOLVERS = ("dinic", "edmonds_karp")
+
+
+def _solve_chunk(task: Tuple[CSRGraph, List[Tuple[int, int, int, str]]]) -> List[Tuple[int, float, float]]:
+    """
+    Worker side: solves every query of the chunk on the arrays, rebuilding the graph
+    once (on first need) for solvers without an array version.
+    """
+    csr, queries = task
+    graph = nodes = None
+    results = []
+    for job, source, sink, solver in queries:
+        if solver in ARRAY_SOLVERS:
+            csr.reset_calculated_flows()
+            start = time.perf_counter()
+            max_flow = getattr(csr, solver)(source, sink)
+        else:
+            if graph is None:
+                graph = csr.to_graph()
+                nodes = list(graph.nodes.values())
+            graph.reset_calculated_flows()
+            start = time.perf_counter()
+            max_flow = getattr(graph, solver)(nodes[source], nodes[sink])
+        results.append((job, max_flow, time.perf_counter() - start))
+    return results
+
+
+def solve_batch(jobs: Iterable[Job], processes: Optional[int] = None,
+                chunk_size: Optional[int] = None) -> List[BatchResult]:
+    """
+    Solves independent max-flow jobs across a process pool and returns the results in
+    job order. Each distinct graph is shipped as a CSRGraph (a handful of flat arrays)
+    instead of pickling the Node/Edge object web, and jobs on the same graph are sent
+    together in chunks. dinic and edmonds_karp run on the arrays directly; for the
+    other solvers a worker rebuilds the graph once per chunk.
+    processes=1 solves everything in the calling process.
+    """
+    processes = processes or os.cpu_count() or 1
+    graphs: Dict[int, Tuple[CSRGraph, List[Tuple[int, int, int, str]]]] = {}
+    count = 0
+    for job, (graph, source, sink, solver) in enumerate(jobs):
+        if solver not in SOLVERS:
+            raise ValueError(f"Unknown solver {solver!r}, expected one of {SOLVERS}")
+        if id(graph) not in graphs:
+            graphs[id(graph)] = (CSRGraph.from_graph(graph), [])
+        csr, queries = graphs[id(graph)]
+        queries.append((job, csr.node_index(source), csr.node_index(sink), solver))
+        count += 1
+
+    tasks = []
+    for csr, queries in graphs.values():
+        size = chunk_size or math.ceil(len(queries) / processes)
+        tasks.extend((csr, queries[i:i + size]) for i in range(0, len(queries), size))
+
+    if processes == 1:
+        chunks = map(_solve_chunk, tasks)
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            chunks = list(executor.map(_solve_chunk, tasks))
+
+    results: List[Optional[BatchResult]] = [None] * count
+    for chunk in chunks:
+        for job, max_flow, seconds in chunk:
+            results[job] = BatchResult(max_flow, seconds)
+    return results
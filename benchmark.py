@@ -0,0 +1,252 @@
+"""
+Headless, reproducible benchmark of the max-flow solvers.
+
+    python benchmark.py --output results.json
+    python benchmark.py --baseline results.json --tolerance 0.25
+    python benchmark.py --startup --families random --sizes 1000
+
+Every case of the seeded corpus is generated once, outside the timed region. Each
+solver then gets warmup runs followed by repeated perf_counter timings (flows are
+reset between runs, untimed), plus one extra run under tracemalloc for the peak
+memory. Results are written as JSON; with --baseline the run exits non-zero when a
+solver's median regressed beyond the tolerance. --startup also times
+`from graph import Graph` in fresh interpreters and fails if it loads plotting libraries.
+"""
+from __future__ import annotations
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from .graph import Graph, Node, SOLVERS
+    from .generators import grid_graph, layered_graph, bipartite_graph, staircase_graph
+except ImportError:  # run as a script
+    from graph import Graph, Node, SOLVERS
+    from generators import grid_graph, layered_graph, bipartite_graph, staircase_graph
+
+# family -> builder(size, seed); size roughly sets the number of nodes
+FAMILIES: Dict[str, Callable[[int, int], Graph]] = {
+    "random": lambda size, seed: Graph.generate_random_graph(size, size * 2, 10, seed=seed),
+    "random_dense": lambda size, seed: Graph.generate_random_graph(size, size * 10, 10, seed=seed),
+    "random_wide": lambda size, seed: Graph.generate_random_graph(size, size * 2, 10 ** 6, seed=seed),  # Capacity scaling
+    "grid": lambda size, seed: grid_graph(max(1, math.isqrt(size)), max(1, math.isqrt(size)), seed=seed),
+    "layered": lambda size, seed: layered_graph(max(1, size // 50), 50, seed=seed),
+    "bipartite": lambda size, seed: bipartite_graph(size // 2, size // 2, size * 2, seed=seed),
+    "staircase": lambda size, seed: staircase_graph(size // 10),  # Quadratic work, keep it small
+}
+
+SIZES = [1000, 10000]
+SEEDS = [0, 1]
+
+HEAVY_MODULES = ("networkx", "matplotlib", "numpy")  # Must not load with `from graph import Graph`
+
+
+def corpus(families: Sequence[str], sizes: Sequence[int], seeds: Sequence[int]) -> List[Tuple[str, int, int]]:
+    return [(family, size, seed) for family in families for size in sizes for seed in seeds]
+
+
+def terminals(graph: Graph) -> Tuple[Node, Node]:
+    return next(iter(graph.nodes.values())), next(reversed(graph.nodes.values()))
+
+
+def percentile(samples: Sequence[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile.
+    """
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def time_solver(graph: Graph, solver: str, source: Node, sink: Node, warmup: int, repeat: int) -> Dict:
+    solve = getattr(graph, solver)
+    for _ in range(warmup):
+        graph.reset_calculated_flows()
+        solve(source, sink)
+
+    timings = []
+    for _ in range(repeat):
+        graph.reset_calculated_flows()
+        start = time.perf_counter()
+        max_flow = solve(source, sink)
+        timings.append(time.perf_counter() - start)
+
+    graph.reset_calculated_flows()
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    solve(source, sink)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    if not tracing:
+        tracemalloc.stop()
+    graph.reset_calculated_flows()
+
+    return {
+        "solver": solver,
+        "max_flow": max_flow,
+        "median": statistics.median(timings),
+        "p95": percentile(timings, 0.95),
+        "min": min(timings),
+        "peak_memory": peak,
+    }
+
+
+def run_case(case: Tuple[str, int, int], solvers: Sequence[str], warmup: int, repeat: int) -> List[Dict]:
+    family, size, seed = case
+    graph = FAMILIES[family](size, seed)
+    source, sink = terminals(graph)
+    name = f"{family}-{size}-s{seed}"
+
+    results = []
+    for solver in solvers:
+        result = {"case": name, "family": family, "size": size, "seed": seed}
+        result.update(time_solver(graph, solver, source, sink, warmup, repeat))
+        results.append(result)
+
+    flows = {result["max_flow"] for result in results}
+    if len(flows) > 1:
+        raise AssertionError(f"Solvers disagree on {name}: {sorted(flows)}")
+    return results
+
+
+def run_benchmarks(cases: Sequence[Tuple[str, int, int]], solvers: Sequence[str] = SOLVERS,
+                   warmup: int = 1, repeat: int = 5, log: Optional[Callable[[str], None]] = None,
+                   processes: int = 1) -> Dict:
+    """
+    Runs every case; with processes > 1 the cases are spread over a process pool
+    (each case is generated inside its worker). Timings then share the machine, so
+    compare parallel runs only with parallel baselines.
+    """
+    if processes > 1:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            count = len(cases)
+            per_case = list(executor.map(run_case, cases, [solvers] * count, [warmup] * count, [repeat] * count))
+    else:
+        per_case = (run_case(case, solvers, warmup, repeat) for case in cases)
+
+    results = []
+    for case_results in per_case:
+        for result in case_results:
+            results.append(result)
+            if log:
+                log(f"{result['case']:28} {result['solver']:22} flow={result['max_flow']:<10} "
+                    f"median={result['median']:.6f}s p95={result['p95']:.6f}s peak={result['peak_memory'] / 1e6:.2f}MB")
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "warmup": warmup,
+            "repeat": repeat,
+            "processes": processes,
+        },
+        "results": results,
+    }
+
+
+def measure_startup(statement: str = "from graph import Graph", repeat: int = 5) -> Dict:
+    """
+    Times `statement` in fresh interpreters started in this directory and reports which
+    of HEAVY_MODULES it pulled in.
+    """
+    code = ("import sys, time\n"
+            "start = time.perf_counter()\n"
+            f"{statement}\n"
+            "print(time.perf_counter() - start)\n"
+            f"print(','.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))\n")
+    directory = os.path.dirname(os.path.abspath(__file__))
+    timings = []
+    loaded = ""
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", code], cwd=directory, capture_output=True,
+                                text=True, check=True).stdout.splitlines()
+        timings.append(float(output[0]))
+        loaded = output[1] if len(output) > 1 else ""
+
+    return {
+        "case": "startup",
+        "solver": statement,
+        "median": statistics.median(timings),
+        "p95": percentile(timings, 0.95),
+        "min": min(timings),
+        "heavy_modules": [name for name in loaded.split(",") if name],
+    }
+
+
+def compare(current: Dict, baseline: Dict, tolerance: float = 0.25, min_delta: float = 0.001) -> List[Dict]:
+    """
+    Results whose median is more than `tolerance` (relative) and `min_delta` seconds
+    slower than the baseline entry for the same case and solver.
+    """
+    previous = {(result["case"], result["solver"]): result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        old = previous.get((result["case"], result["solver"]))
+        if old is None:
+            continue
+        if result["median"] > old["median"] * (1 + tolerance) and result["median"] - old["median"] > min_delta:
+            regressions.append({
+                "case": result["case"],
+                "solver": result["solver"],
+                "baseline": old["median"],
+                "median": result["median"],
+                "ratio": result["median"] / old["median"],
+            })
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the max-flow solvers on a seeded corpus.")
+    parser.add_argument("--families", nargs="+", default=list(FAMILIES), choices=list(FAMILIES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--seeds", nargs="+", type=int, default=SEEDS)
+    parser.add_argument("--solvers", nargs="+", default=list(SOLVERS), choices=list(SOLVERS))
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--processes", type=int, default=1, help="run cases in parallel worker processes")
+    parser.add_argument("--startup", action="store_true", help="also time `from graph import Graph` in fresh interpreters")
+    parser.add_argument("--output", help="write the results as JSON to this file (default: stdout)")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown of the median")
+    args = parser.parse_args(argv)
+
+    log = lambda line: print(line, file=sys.stderr)
+    results = run_benchmarks(corpus(args.families, args.sizes, args.seeds), args.solvers,
+                             args.warmup, args.repeat, log, args.processes)
+    failed = False
+    if args.startup:
+        startup = measure_startup(repeat=args.repeat)
+        results["results"].append(startup)
+        log(f"{'startup':28} {startup['solver']:22} median={startup['median']:.6f}s "
+            f"heavy modules={startup['heavy_modules'] or 'none'}")
+        failed = bool(startup["heavy_modules"])
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        for regression in regressions:
+            log(f"REGRESSION {regression['case']} {regression['solver']}: "
+                f"{regression['baseline']:.6f}s -> {regression['median']:.6f}s ({regression['ratio']:.2f}x)")
+        failed = failed or bool(regressions)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Tuple
+
+try:
+    from .graph import Graph, Node, SOLVERS
+except ImportError:  # imported as a top-level script module
+    from graph import Graph, Node, SOLVERS
+
+# (graph fingerprint, source name, sink name); the max-flow value does not depend on the solver
+CacheKey = Tuple[int, str, str]
+
+
+class FlowCache:
+    """
+    LRU cache of max-flow values keyed by Graph.fingerprint and the terminals.
+
+    Changing a capacity through add_edge or update_capacities changes the fingerprint,
+    so stale results are never returned; they simply age out of the cache. A hit returns
+    the stored value without touching the edge flows. A miss resets the flows, runs the
+    solver and leaves its maximum flow on the edges.
+    """
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results: OrderedDict[CacheKey, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __repr__(self): return f"FlowCache({len(self)}/{self.maxsize} entries, {self.hits} hits, {self.misses} misses)"
+
+    def max_flow(self, graph: Graph, source: Node, sink: Node, solver: str = "dinic") -> float:
+        if solver not in SOLVERS:
+            raise ValueError(f"Unknown solver {solver!r}, expected one of {SOLVERS}")
+        key = (graph.fingerprint, source.name, sink.name)
+        results = self._results
+        if key in results:
+            self.hits += 1
+            results.move_to_end(key)
+            return results[key]
+
+        self.misses += 1
+        graph.reset_calculated_flows()
+        max_flow = getattr(graph, solver)(source, sink)
+        results[key] = max_flow
+        if len(results) > self.maxsize:
+            results.popitem(last=False)
+        return max_flow
+
+    def clear(self) -> None:
+        self._results.clear()
+        self.hits = self.misses = 0
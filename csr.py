@@ -0,0 +1,403 @@
+from __future__ import annotations
+from array import array
+from collections import deque
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    from .graph import Edge, Graph, Node
+except ImportError:  # imported as a top-level script module
+    from graph import Edge, Graph, Node
+
+
+class CSRGraph:
+    """
+    Array-backed residual graph in CSR (compressed sparse row) layout.
+
+    The arcs leaving node u live at positions offsets[u] .. offsets[u + 1] - 1
+    of the heads, capacity, flow and reverse arrays. reverse[a] is the index of
+    the paired residual arc, the array equivalent of Edge.reverse. cost holds
+    Edge.cost per arc, or is None when every cost is zero.
+    """
+    def __init__(self, offsets: Sequence[int], heads: Sequence[int], capacity: Sequence[float],
+                 reverse: Sequence[int], names: Optional[List[str]] = None,
+                 flow: Optional[Sequence[float]] = None, cost: Optional[Sequence[float]] = None) -> None:
+        self.offsets = offsets
+        self.heads = heads
+        self.capacity = capacity
+        self.reverse = reverse
+        self.flow = flow if flow is not None else array('d', bytes(8 * len(heads)))
+        self.names = names
+        self.cost = cost
+        self.directed = False  # Only used by to_graph; reverse capacities are already in the arrays
+        self.level: List[int] = []  # Stores the level graph for BFS
+        self.pair_arcs: Optional[array] = None  # Forward arc of each input pair, set by from_arrays
+        self._name_index: Optional[dict] = None
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def num_arcs(self) -> int:
+        return len(self.heads)
+
+    def __repr__(self): return f"CSRGraph({self.num_nodes} nodes, {self.num_arcs} arcs)"
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> CSRGraph:
+        """
+        Builds the arrays from a Node/Edge graph, keeping node order and the order
+        of every node's edge list. Current Edge.flow values and edge costs are copied as well.
+        """
+        nodes = list(graph.nodes.values())
+        index = {node: i for i, node in enumerate(nodes)}
+        arc_of = {}  # Edge -> arc index (edges hash by identity)
+
+        offsets = array('q', [0])
+        heads = array('q')
+        capacity = array('d')
+        flow = array('d')
+        cost = array('d')
+        for node in nodes:
+            for edge in node.edges:
+                arc_of[edge] = len(heads)
+                heads.append(index[edge.target])
+                capacity.append(edge.capacity)
+                flow.append(edge.flow)
+                cost.append(edge.cost)
+            offsets.append(len(heads))
+
+        reverse = array('q', [arc_of[edge.reverse] for node in nodes for edge in node.edges])
+        csr = cls(offsets, heads, capacity, reverse, [node.name for node in nodes], flow,
+                  cost if any(cost) else None)
+        csr.directed = graph.directed
+        return csr
+
+    @classmethod
+    def from_edges(cls, num_nodes: int, edges: Iterable[Tuple[int, int, float]],
+                   names: Optional[List[str]] = None, directed: bool = False) -> CSRGraph:
+        """
+        Builds the arrays from (tail, head, capacity) triples over nodes 0 .. num_nodes - 1.
+        Each triple behaves like tail.add_edge(head, capacity, directed).
+        """
+        tails = array('q')
+        heads = array('q')
+        capacities = array('d')
+        for u, v, capacity in edges:
+            tails.append(u)
+            heads.append(v)
+            capacities.append(capacity)
+        reverse_capacities = array('d', bytes(8 * len(capacities))) if directed else capacities
+        return cls.from_arrays(num_nodes, tails, heads, capacities, reverse_capacities, names)
+
+    @classmethod
+    def from_arrays(cls, num_nodes: int, tails: Sequence[int], heads: Sequence[int],
+                    capacities: Sequence[float], reverse_capacities: Optional[Sequence[float]] = None,
+                    names: Optional[List[str]] = None) -> CSRGraph:
+        """
+        Builds the arrays from parallel per-pair columns with a counting sort on the tail.
+        Pair i becomes a forward arc tails[i] -> heads[i] and its reverse arc, both
+        placed in input order like repeated Node.add_edge calls would place them.
+        reverse_capacities defaults to capacities (the add_edge semantics).
+        """
+        if reverse_capacities is None:
+            reverse_capacities = capacities
+        num_pairs = len(tails)
+
+        offsets = array('q', bytes(8 * (num_nodes + 1)))
+        for i in range(num_pairs):
+            offsets[tails[i] + 1] += 1
+            offsets[heads[i] + 1] += 1
+        for u in range(num_nodes):
+            offsets[u + 1] += offsets[u]
+
+        num_arcs = 2 * num_pairs
+        arc_heads = array('q', bytes(8 * num_arcs))
+        capacity = array('d', bytes(8 * num_arcs))
+        reverse = array('q', bytes(8 * num_arcs))
+        pair_arcs = array('q', bytes(8 * num_pairs))
+        position = offsets[:-1]  # Next free slot of every node
+
+        for i in range(num_pairs):
+            u = tails[i]
+            v = heads[i]
+            a = position[u]
+            position[u] = a + 1
+            b = position[v]
+            position[v] = b + 1
+            arc_heads[a] = v
+            arc_heads[b] = u
+            capacity[a] = capacities[i]
+            capacity[b] = reverse_capacities[i]
+            reverse[a] = b
+            reverse[b] = a
+            pair_arcs[i] = a
+
+        graph = cls(offsets, arc_heads, capacity, reverse, names)
+        graph.pair_arcs = pair_arcs
+        return graph
+
+    def to_graph(self, directed: Optional[bool] = None) -> Graph:
+        """
+        Rebuilds Node/Edge objects with the same node order, edge order, capacities, costs
+        and flows. directed defaults to the flag of the graph this was built from.
+        """
+        offsets, heads, capacity, flow, cost = self.offsets, self.heads, self.capacity, self.flow, self.cost
+        names = self.names if self.names is not None else [str(u) for u in range(self.num_nodes)]
+        nodes = [Node(name) for name in names]
+        edges: List[Edge] = []
+        for u, node in enumerate(nodes):
+            for a in range(offsets[u], offsets[u + 1]):
+                edge = Edge(nodes[heads[a]], capacity[a], cost[a] if cost is not None else 0)
+                edge.flow = flow[a]
+                node.edges.append(edge)
+                edges.append(edge)
+        for edge, b in zip(edges, self.reverse):
+            edge.reverse = edges[b]
+        return Graph({node.name: node for node in nodes}, self.directed if directed is None else directed)
+
+    def node_index(self, node: Union[int, str, Node]) -> int:
+        """
+        Resolves a node index, a node name or a Node (by its name) to an index.
+        """
+        if isinstance(node, int):
+            return node
+        if self._name_index is None:
+            if self.names is None:
+                raise KeyError(f"{self!r} has no node names")
+            self._name_index = {name: i for i, name in enumerate(self.names)}
+        return self._name_index[node.name if isinstance(node, Node) else node]
+
+    def workspace(self) -> CSRGraph:
+        """
+        A CSRGraph sharing this graph's topology and capacity arrays but with its own
+        flow and level arrays. Solvers never write the shared arrays, so separate
+        workspaces can solve concurrently (threads, asyncio executors) without locks
+        or copies. Reuse one with reset_calculated_flows, or just drop it.
+        """
+        if self._name_index is None and self.names is not None:  # Built once, shared by every workspace
+            self._name_index = {name: i for i, name in enumerate(self.names)}
+        workspace = CSRGraph(self.offsets, self.heads, self.capacity, self.reverse, self.names, cost=self.cost)
+        workspace.directed = self.directed
+        workspace.pair_arcs = self.pair_arcs
+        workspace._name_index = self._name_index
+        return workspace
+
+    def reset_calculated_flows(self) -> None:
+        self.flow[:] = array('d', bytes(8 * len(self.flow)))
+
+    def apply_flows(self, graph: Graph) -> None:
+        """
+        Copies the arc flows back onto the Edge objects of the graph this was built from.
+        """
+        graph.level_source = None
+        flow = self.flow
+        a = 0
+        for node in graph.nodes.values():
+            for edge in node.edges:
+                edge.flow = flow[a]
+                a += 1
+
+    def decompose_flow(self, source: Union[int, Node], sink: Union[int, Node],
+                       cycles: bool = False) -> Iterator[Tuple[float, List[int]]]:
+        """
+        Lazily splits the current flow into (amount, path) pairs of source-sink paths
+        of node indices. A walk along positive-flow arcs that runs into itself has found
+        a cycle, which is cancelled on the spot; with cycles=True it is yielded as well
+        (path[0] == path[-1]), and so are the circulations not reachable from the source.
+        Each yield zeroes at least one arc and current-arc pointers make every arc scanned
+        once per walk position, so the whole decomposition takes O(VE). The flow arrays
+        are left untouched.
+        """
+        source, sink = self.node_index(source), self.node_index(sink)
+        offsets, heads = self.offsets, self.heads
+        remaining = array('d', self.flow)
+        current_arc = array('q', offsets[:-1])
+        position = [-1] * self.num_nodes  # Index of each node on the current walk
+
+        def next_arc(u: int) -> int:
+            a = current_arc[u]
+            end = offsets[u + 1]
+            while a < end and remaining[a] <= 0:
+                a += 1
+            current_arc[u] = a
+            return a if a < end else -1
+
+        def walks(start: int) -> Iterator[Tuple[float, List[int]]]:
+            nodes = [start]
+            arcs: List[int] = []
+            position[start] = 0
+            while nodes:
+                u = nodes[-1]
+                if u == sink and start == source:
+                    amount = min(remaining[a] for a in arcs)
+                    for a in arcs:
+                        remaining[a] -= amount
+                    yield amount, list(nodes)
+                    for v in nodes[1:]:
+                        position[v] = -1
+                    del nodes[1:], arcs[:]
+                    continue
+
+                a = next_arc(u)
+                if a < 0:  # Nothing leaves u: back off (only the start, or a flow that is not conserved)
+                    position[nodes.pop()] = -1
+                    if arcs:
+                        arcs.pop()
+                        current_arc[nodes[-1]] += 1  # Skip the arc into the dead end
+                    continue
+
+                v = heads[a]
+                if position[v] < 0:
+                    position[v] = len(nodes)
+                    nodes.append(v)
+                    arcs.append(a)
+                    continue
+
+                # Closed a cycle v -> ... -> u -> v: cancel it and resume from v
+                i = position[v]
+                cycle_arcs = arcs[i:] + [a]
+                amount = min(remaining[b] for b in cycle_arcs)
+                for b in cycle_arcs:
+                    remaining[b] -= amount
+                if cycles:
+                    yield amount, nodes[i:] + [v]
+                for w in nodes[i + 1:]:
+                    position[w] = -1
+                del nodes[i + 1:], arcs[i:]
+
+        yield from walks(source)
+        if cycles:
+            for u in range(self.num_nodes):
+                if next_arc(u) >= 0:
+                    yield from walks(u)
+
+    def dinic_bfs(self, source: int, sink: int) -> bool:
+        """
+        BFS to construct the level graph and check if a path exists from source to sink.
+        """
+        offsets, heads, capacity, flow = self.offsets, self.heads, self.capacity, self.flow
+        level = [-1] * self.num_nodes
+        level[source] = 0
+        queue = deque([source])
+
+        while queue:
+            u = queue.popleft()
+            next_level = level[u] + 1
+            for a in range(offsets[u], offsets[u + 1]):
+                v = heads[a]
+                if level[v] < 0 and capacity[a] - flow[a] > 0:
+                    level[v] = next_level
+                    queue.append(v)
+
+        self.level = level
+        return level[sink] >= 0
+
+    def dinic_blocking_flow(self, source: int, sink: int) -> float:
+        """
+        Iterative DFS that saturates the level graph. Every node keeps a current-arc
+        pointer, so arcs that are saturated or lead to dead ends are never rescanned.
+        """
+        offsets, heads, capacity, flow, reverse = self.offsets, self.heads, self.capacity, self.flow, self.reverse
+        level = self.level
+        current_arc = list(offsets[:-1])
+        path: List[int] = []  # Arcs from source to u
+        total = 0.0
+        u = source
+
+        while True:
+            if u == sink:
+                bottleneck = min(capacity[a] - flow[a] for a in path)
+                for a in path:
+                    flow[a] += bottleneck
+                    flow[reverse[a]] -= bottleneck
+                total += bottleneck
+
+                # Retreat to the tail of the first saturated arc and continue from there
+                for i, a in enumerate(path):
+                    if capacity[a] - flow[a] <= 0:
+                        break
+                del path[i:]
+                u = heads[path[-1]] if path else source
+                continue
+
+            end = offsets[u + 1]
+            next_level = level[u] + 1
+            a = current_arc[u]
+            while a < end and (level[heads[a]] != next_level or capacity[a] - flow[a] <= 0):
+                a += 1
+            current_arc[u] = a
+
+            if a < end:
+                path.append(a)
+                u = heads[a]
+            elif path:  # Dead end: drop the arc leading here
+                a = path.pop()
+                u = heads[reverse[a]]
+                current_arc[u] += 1
+            else:
+                return total
+
+    def dinic(self, source: Union[int, Node], sink: Union[int, Node]) -> float:
+        """
+        Dinic's algorithm implementation.
+        """
+        source, sink = self.node_index(source), self.node_index(sink)
+        max_flow = 0.0
+
+        while self.dinic_bfs(source, sink):  # Construct level graph
+            max_flow += self.dinic_blocking_flow(source, sink)
+
+        return max_flow
+
+    def bfs(self, source: int, sink: int) -> Optional[List[int]]:
+        """
+        Perform BFS to find an augmenting path from source to sink.
+        Returns a list mapping each node to the arc used to reach it (-1 if unreached),
+        or None if no path exists.
+        """
+        offsets, heads, capacity, flow = self.offsets, self.heads, self.capacity, self.flow
+        parent = [-1] * self.num_nodes
+        queue = deque([source])
+
+        while queue:
+            u = queue.popleft()
+            for a in range(offsets[u], offsets[u + 1]):
+                v = heads[a]
+                if parent[v] < 0 and capacity[a] - flow[a] > 0:
+                    parent[v] = a
+                    if v == sink:
+                        return parent
+                    queue.append(v)
+
+        return None
+
+    def edmonds_karp(self, source: Union[int, Node], sink: Union[int, Node]) -> float:
+        source, sink = self.node_index(source), self.node_index(sink)
+        heads, capacity, flow, reverse = self.heads, self.capacity, self.flow, self.reverse
+        max_flow = 0.0
+
+        while True:
+            parent = self.bfs(source, sink)
+            if parent is None:  # No more augmenting paths
+                break
+
+            # Bottleneck capacity along the path
+            path_flow = float('inf')
+            v = sink
+            while v != source:
+                a = parent[v]
+                path_flow = min(path_flow, capacity[a] - flow[a])
+                v = heads[reverse[a]]
+
+            # Augment flow along the path
+            v = sink
+            while v != source:
+                a = parent[v]
+                flow[a] += path_flow
+                flow[reverse[a]] -= path_flow
+                v = heads[reverse[a]]
+
+            max_flow += path_flow
+
+        return max_flow
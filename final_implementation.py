@@ -2,8 +2,6 @@ from __future__ import annotations
 from collections import deque
 import random
 from typing import List, Dict, Optional
-import networkx as nx
-import matplotlib.pyplot as plt
 
 
 class Edge:
@@ -182,32 +180,13 @@ class Graph:
     def plot_graph(self, step: int) -> None:
         """
         Visualizes the graph after each step of augmentation.
+        networkx and matplotlib are imported on first use only.
         """
-        G = nx.DiGraph()  # directed graph
-
-        # Add nodes
-        for node in self.nodes.values():
-            G.add_node(node.name)
-
-        # Add edges with capacity and flow as labels
-        for node in self.nodes.values():
-            for edge in node.edges:
-                if edge.capacity > 0:
-                    flow_label = f"Flow: {-edge.flow}"
-                    capacity_label = f"Capacity: {edge.capacity}"
-                    G.add_edge(node.name, edge.target.name, label=f"{capacity_label}\n{flow_label}")
-
-        # Draw the graph
-        pos = nx.spring_layout(G, seed=1)
-        plt.figure(figsize=(8, 6))
-        nx.draw(G, pos, with_labels=True, node_size=3000, node_color="lightblue", font_size=12, font_weight="bold", arrows=True)
-        
-        # Edge labels for capacity and flow
-        edge_labels = nx.get_edge_attributes(G, "label")
-        nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, font_size=10)
-
-        plt.title(f"Graph at Step {step}")
-        plt.show()
+        if __package__:
+            from .visualization import plot_graph
+        else:
+            from visualization import plot_graph
+        plot_graph(self, step)
 
     def edmonds_karp_demo(self, source: Node, sink: Node) -> float:
         max_flow = 0
@@ -0,0 +1,119 @@
+from __future__ import annotations
+from array import array
+import random
+from typing import List, Optional
+
+try:
+    from .graph import Graph, Node, generate_random_edges
+    from .csr import CSRGraph
+except ImportError:  # imported as a top-level script module
+    from graph import Graph, Node, generate_random_edges
+    from csr import CSRGraph
+
+# Every family returns a Graph whose first node is the source and whose last node is
+# the sink, which is how analysis.py picks its terminals.
+
+
+def random_csr(num_nodes: int, num_edges: int, max_edge_capacity: int = 10, directed: bool = False,
+               seed: Optional[int] = None) -> CSRGraph:
+    """
+    Same instance family as Graph.generate_random_graph, built straight into arrays
+    without Node/Edge objects. Suited for graphs with millions of edges.
+    """
+    tails, heads, capacities = generate_random_edges(num_nodes, num_edges, max_edge_capacity, seed)
+    capacities = array('d', capacities)
+    reverse_capacities = array('d', bytes(8 * len(capacities))) if directed else capacities
+    graph = CSRGraph.from_arrays(num_nodes, tails, heads, capacities, reverse_capacities,
+                                 [f"Node{i}" for i in range(num_nodes)])
+    graph.directed = directed
+    return graph
+
+
+def grid_graph(rows: int, cols: int, max_edge_capacity: int = 10, directed: bool = False,
+               seed: Optional[int] = None) -> Graph:
+    """
+    rows x cols grid with random capacities on the right and down edges. The source
+    feeds the first column and the last column drains into the sink. Long, narrow
+    grids give deep level graphs with many equal-length paths.
+    """
+    rng = random.Random(seed)
+    source, sink = Node("S"), Node("T")
+    cells = [[Node(f"Node{r}_{c}") for c in range(cols)] for r in range(rows)]
+    graph = Graph({"S": source, **{node.name: node for row in cells for node in row}, "T": sink}, directed)
+
+    for r in range(rows):
+        graph.add_edge(source, cells[r][0], max_edge_capacity)
+        graph.add_edge(cells[r][cols - 1], sink, max_edge_capacity)
+        for c in range(cols):
+            if c + 1 < cols:
+                graph.add_edge(cells[r][c], cells[r][c + 1], rng.randint(1, max_edge_capacity))
+            if r + 1 < rows:
+                graph.add_edge(cells[r][c], cells[r + 1][c], rng.randint(1, max_edge_capacity))
+    return graph
+
+
+def layered_graph(layers: int, width: int, degree: int = 3, max_edge_capacity: int = 10, directed: bool = True,
+                  seed: Optional[int] = None) -> Graph:
+    """
+    Layered DAG: every node links to `degree` random nodes of the next layer, the source
+    feeds the first layer and the last layer drains into the sink. Every source-sink
+    path has the same length, so Dinic finishes in one phase.
+    """
+    rng = random.Random(seed)
+    degree = min(degree, width)
+    source, sink = Node("S"), Node("T")
+    levels = [[Node(f"Node{i}_{j}") for j in range(width)] for i in range(layers)]
+    graph = Graph({"S": source, **{node.name: node for level in levels for node in level}, "T": sink}, directed)
+
+    for node in levels[0]:
+        graph.add_edge(source, node, degree * max_edge_capacity)
+    for i in range(layers - 1):
+        for node in levels[i]:
+            for target in rng.sample(levels[i + 1], degree):
+                graph.add_edge(node, target, rng.randint(1, max_edge_capacity))
+    for node in levels[-1]:
+        graph.add_edge(node, sink, degree * max_edge_capacity)
+    return graph
+
+
+def bipartite_graph(left: int, right: int, num_edges: int, directed: bool = True,
+                    seed: Optional[int] = None) -> Graph:
+    """
+    Unit-capacity bipartite assignment instance: source -> left nodes -> right nodes -> sink,
+    with num_edges distinct random left-right edges.
+    """
+    if num_edges > left * right:
+        raise ValueError("Number of edges exceeds the number of left-right pairs.")
+    rng = random.Random(seed)
+    source, sink = Node("S"), Node("T")
+    left_nodes = [Node(f"L{i}") for i in range(left)]
+    right_nodes = [Node(f"R{j}") for j in range(right)]
+    graph = Graph({"S": source, **{node.name: node for node in left_nodes + right_nodes}, "T": sink}, directed)
+
+    for node in left_nodes:
+        graph.add_edge(source, node, 1)
+    for key in rng.sample(range(left * right), num_edges):
+        i, j = divmod(key, right)
+        graph.add_edge(left_nodes[i], right_nodes[j], 1)
+    for node in right_nodes:
+        graph.add_edge(node, sink, 1)
+    return graph
+
+
+def staircase_graph(steps: int, directed: bool = True) -> Graph:
+    """
+    Known hard case for augmenting-path methods: a chain source -> 1 -> 2 -> ... -> steps
+    where chain node i also has a unit edge to the sink. The i-th shortest augmenting path
+    has length i + 1, so Edmonds-Karp needs `steps` BFS passes and Dinic `steps` phases,
+    Theta(V^2) work on a graph with O(V) edges.
+    """
+    source, sink = Node("S"), Node("T")
+    chain: List[Node] = [Node(f"Node{i}") for i in range(1, steps + 1)]
+    graph = Graph({"S": source, **{node.name: node for node in chain}, "T": sink}, directed)
+
+    previous = source
+    for node in chain:
+        graph.add_edge(previous, node, steps)
+        graph.add_edge(node, sink, 1)
+        previous = node
+    return graph
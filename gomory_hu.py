@@ -0,0 +1,85 @@
+from __future__ import annotations
+from typing import List
+
+try:
+    from .graph import Graph, Node
+except ImportError:  # imported as a top-level script module
+    from graph import Graph, Node
+
+
+class GomoryHuTree:
+    """
+    All-pairs minimum cut values of an undirected graph (every edge's reverse has the
+    same capacity, as Node.add_edge creates it).
+
+    Built with Gusfield's algorithm: n - 1 max-flow computations on the original graph,
+    no contractions. The max flow between any two nodes is then the smallest weight on
+    their tree path, answered in O(log n) with binary lifting.
+    """
+    def __init__(self, graph: Graph) -> None:
+        if graph.directed:
+            raise ValueError("Gomory-Hu trees need an undirected graph.")
+        self.nodes: List[Node] = list(graph.nodes.values())
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        n = len(self.nodes)
+
+        # parent[i] < i for every i > 0, so node 0 is the root
+        self.parent = [0] * n
+        self.weight = [float('inf')] * n  # Min cut between i and parent[i]
+        for s in range(1, n):
+            t = self.parent[s]
+            graph.reset_calculated_flows()
+            self.weight[s] = graph.dinic(self.nodes[s], self.nodes[t])
+            source_side = graph.residual_reachable(self.nodes[s])  # Reuses dinic's last BFS
+            for i in range(s + 1, n):
+                if self.parent[i] == t and self.nodes[i] in source_side:
+                    self.parent[i] = s
+        graph.reset_calculated_flows()
+
+        # Binary lifting tables: up[k][i] is the 2^k-th ancestor of i and
+        # low[k][i] the smallest weight on the way there
+        self.depth = [0] * n
+        for i in range(1, n):
+            self.depth[i] = self.depth[self.parent[i]] + 1
+        self.up = [self.parent[:]]
+        self.low = [self.weight[:]]
+        while (1 << len(self.up)) < n:
+            up, low = self.up[-1], self.low[-1]
+            self.up.append([up[up[i]] for i in range(n)])
+            self.low.append([min(low[i], low[up[i]]) for i in range(n)])
+
+    def __repr__(self): return f"GomoryHuTree over {len(self.nodes)} nodes"
+
+    def edges(self) -> List[tuple[Node, Node, float]]:
+        """
+        Tree edges as (node, parent, min cut value) triples.
+        """
+        return [(self.nodes[i], self.nodes[self.parent[i]], self.weight[i]) for i in range(1, len(self.nodes))]
+
+    def max_flow(self, source: Node, sink: Node) -> float:
+        """
+        Max-flow (min-cut) value between source and sink.
+        """
+        u, v = self.index[source], self.index[sink]
+        if u == v:
+            return float('inf')
+
+        result = float('inf')
+        if self.depth[u] < self.depth[v]:
+            u, v = v, u
+        diff = self.depth[u] - self.depth[v]
+        k = 0
+        while diff:
+            if diff & 1:
+                result = min(result, self.low[k][u])
+                u = self.up[k][u]
+            diff >>= 1
+            k += 1
+        if u == v:
+            return result
+
+        for k in range(len(self.up) - 1, -1, -1):
+            if self.up[k][u] != self.up[k][v]:
+                result = min(result, self.low[k][u], self.low[k][v])
+                u, v = self.up[k][u], self.up[k][v]
+        return min(result, self.low[0][u], self.low[0][v])
@@ -1,15 +1,23 @@
 from __future__ import annotations
+from array import array
 from collections import deque
+from heapq import heappop, heappush
+from itertools import count
 import random
-from typing import List, Dict, Optional
-import networkx as nx
-import matplotlib.pyplot as plt
+import time
+import tracemalloc
+from typing import Iterable, Iterator, List, Dict, Optional, Set, Tuple, Union
+
+
+FINGERPRINT_MASK = (1 << 64) - 1
+EXCESS_TOLERANCE = 1e-9  # push_relabel treats smaller excess as float rounding, not flow to move
 
 
 class Edge:
-    def __init__(self, target: Node, capacity: float) -> None:
+    def __init__(self, target: Node, capacity: float, cost: float = 0) -> None:
         self.target = target
         self.capacity = capacity
+        self.cost = cost  # Per unit of flow; the reverse edge has the negated cost
         self.flow = 0
         self.reverse: Optional[Edge] = None  # Reverse edge reference
 
@@ -19,11 +27,19 @@ class Node:
     def __init__(self, name: str) -> None:
         self.name = name
         self.edges: List[Edge] = []  # List of edges connected to this node
+        self.graph: Optional[Graph] = None  # Graph the node belongs to, told about new edges
 
-    def add_edge(self, target: Node, capacity: float) -> None:
-
-        forward_edge = Edge(target, capacity)
-        reverse_edge = Edge(self, capacity)
+    def add_edge(self, target: Node, capacity: float, directed: bool = False, cost: float = 0) -> None:
+        """
+        Adds an edge and its reverse residual edge. The reverse edge gets the same
+        capacity (undirected), or zero capacity when directed is set. A per-unit cost
+        is only allowed on directed edges: the reverse edge carries the negated cost,
+        which refunds cancelled flow but cannot price flow in the other direction.
+        """
+        if cost and not directed:
+            raise ValueError("Edges with a cost must be directed.")
+        forward_edge = Edge(target, capacity, cost)
+        reverse_edge = Edge(self, 0 if directed else capacity, -cost)
 
         forward_edge.reverse = reverse_edge
         reverse_edge.reverse = forward_edge
@@ -31,109 +47,407 @@ class Node:
         self.edges.append(forward_edge)
         target.edges.append(reverse_edge)
 
+        graph = self.graph or target.graph
+        if graph is not None:  # Keep the graph's fingerprint and cached level graph current
+            self.graph = target.graph = graph
+            graph.level_source = None
+            graph._track_capacity(self, forward_edge, None)
+            graph._track_capacity(target, reverse_edge, None)
+
     def __repr__(self): return self.name
 
+class MinCut:
+    def __init__(self, source_side: Set[Node], edges: List[Edge], capacity: float) -> None:
+        self.source_side = source_side  # Nodes reachable from the source in the residual graph
+        self.edges = edges  # Edges leaving source_side, all saturated
+        self.capacity = capacity
+
+    def __repr__(self): return f"MinCut of capacity {self.capacity} over {len(self.edges)} edges"
+
+class BoundedFlow:
+    def __init__(self, flow: float, upper_bound: float, phases: int) -> None:
+        self.flow = flow  # Value of the flow stored on the edges
+        self.upper_bound = upper_bound  # Proven bound on the maximum flow
+        self.phases = phases
+
+    @property
+    def optimal(self) -> bool:
+        return self.flow >= self.upper_bound
+
+    def __repr__(self): return f"BoundedFlow({self.flow} <= max flow <= {self.upper_bound} after {self.phases} phases)"
+
+class SolverObserver:
+    """
+    Hooks called by dinic and edmonds_karp. Override the ones you need; solvers only
+    call them when an observer is passed, never from inside the edge scanning loops.
+    """
+    def phase_started(self, graph: Graph, phase: int) -> None: pass
+
+    def level_graph_built(self, graph: Graph, level: Dict[Node, int]) -> None: pass
+
+    def path_augmented(self, graph: Graph, flow: float, path: List[Node]) -> None: pass
+
+    def phase_finished(self, graph: Graph, phase: int, max_flow: float) -> None: pass
+
+class DinicPrinter(SolverObserver):
+    """
+    Step-by-step teaching output of dinic_demo.
+    """
+    def phase_started(self, graph: Graph, phase: int) -> None:
+        print(f"Step {phase}")
+
+    def level_graph_built(self, graph: Graph, level: Dict[Node, int]) -> None:
+        print(f"Level Graph", level)
+
+    def path_augmented(self, graph: Graph, flow: float, path: List[Node]) -> None:
+        print(f" Found Flow {flow}", path)
+
+    def phase_finished(self, graph: Graph, phase: int, max_flow: float) -> None:
+        print(f" Stopping Flow reached, new max flow: {max_flow}")
+
+class EdmondsKarpPrinter(SolverObserver):
+    """
+    Step-by-step teaching output of edmonds_karp_demo, with a plot after every augmentation.
+    """
+    def __init__(self, plot: bool = True) -> None:
+        self.plot = plot
+        self.flow = 0
+        self.path: List[Node] = []
+
+    def path_augmented(self, graph: Graph, flow: float, path: List[Node]) -> None:
+        self.flow = flow
+        self.path = path
+
+    def phase_finished(self, graph: Graph, phase: int, max_flow: float) -> None:
+        print(f"\n=== Augmentation Step {phase} ===")
+        print(f"Augmenting Path: {' -> '.join(node.name for node in self.path)}")
+        print(f"Bottleneck Capacity: {self.flow}")
+        print(f"Updated Flows:")
+
+        for node in graph.nodes.values():
+            for edge in node.edges:
+                if edge.capacity > 0 and edge.flow>0:  # Only print forward edges
+                    print(f"  {node.name} -> {edge.target.name} | Capacity: {edge.capacity}, Flow: {edge.flow}")
+
+        if self.plot:
+            graph.plot_graph(phase)
+
+class SolverStats(SolverObserver):
+    """
+    Instrumentation counters for one dinic or edmonds_karp run, see Graph.profile.
+    Everything is derived once per phase from the solver's level map, BFS tree and
+    the per-node scan tally of dinic's DFS (Graph.blocking_scans), so the edge
+    scanning loops carry no observer calls. For edmonds_karp every augmentation is
+    a phase.
+    """
+    def __init__(self, solver: str, source: Node, sink: Node) -> None:
+        self.solver = solver
+        self.source = source
+        self.sink = sink
+        self.max_flow = 0
+        self.phases = 0
+        self.augmentations = 0
+        self.arc_scans = 0  # Edges examined by BFS and DFS
+        self.max_level = 0  # Deepest BFS level reached
+        self.phase_times: List[float] = []
+        self.wall_time = 0.0
+        self.peak_memory = 0  # Bytes allocated by the solver at its peak, if traced
+        self._started = 0.0
+        self._phase_started = 0.0
+        self._memory_base = 0
+        self._tracing = False
+
+    def __repr__(self): return f"SolverStats({self.solver}: {self.phases} phases, {self.augmentations} augmentations)"
+
+    def start(self, trace_memory: bool = True) -> None:
+        """
+        Called right before the solver runs. Memory tracing makes the solve itself slower.
+        """
+        if trace_memory:
+            self._tracing = not tracemalloc.is_tracing()
+            if self._tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self._memory_base = tracemalloc.get_traced_memory()[0]
+        self._started = self._phase_started = time.perf_counter()
+
+    def finish(self, graph: Graph, max_flow: float) -> None:
+        self.wall_time = time.perf_counter() - self._started
+        self.max_flow = max_flow
+        if tracemalloc.is_tracing():
+            self.peak_memory = tracemalloc.get_traced_memory()[1] - self._memory_base
+            if self._tracing:
+                tracemalloc.stop()
+
+        # The last BFS, which found no path, never starts a phase
+        if self.solver == "dinic":
+            self._count_level_graph(graph.level)
+        else:
+            self.arc_scans += self._bfs_scans(graph.parent_map)
+
+    def _count_level_graph(self, level: Dict[Node, int]) -> None:
+        # Every node reached by the BFS had all of its edges scanned
+        self.arc_scans += sum(len(node.edges) for node, depth in level.items() if depth != -1)
+        self.max_level = max(self.max_level, max(level.values(), default=0))
+
+    def _bfs_scans(self, parent_map: Dict[Node, Edge]) -> int:
+        # parent_map is in discovery order, which is also the order nodes left the queue
+        popped = [self.source] + list(parent_map)
+        edge = parent_map.get(self.sink)
+        if edge is None:  # Failed search: every discovered node was scanned
+            return sum(len(node.edges) for node in popped)
+        last = edge.reverse.target
+        k = popped.index(last)
+        return sum(len(node.edges) for node in popped[:k]) + last.edges.index(edge) + 1
+
+    def phase_started(self, graph: Graph, phase: int) -> None:
+        self.phases += 1
+
+    def level_graph_built(self, graph: Graph, level: Dict[Node, int]) -> None:
+        self._count_level_graph(level)
+
+    def path_augmented(self, graph: Graph, flow: float, path: List[Node]) -> None:
+        self.augmentations += 1
+        if self.solver != "dinic":
+            self.max_level = max(self.max_level, len(path) - 1)
+
+    def phase_finished(self, graph: Graph, phase: int, max_flow: float) -> None:
+        if self.solver == "dinic":
+            self.arc_scans += graph.blocking_scans
+        else:
+            self.arc_scans += self._bfs_scans(graph.parent_map)
+        now = time.perf_counter()
+        self.phase_times.append(now - self._phase_started)  # Includes the phase's BFS
+        self._phase_started = now
+
+    def as_dict(self) -> Dict:
+        return {
+            "solver": self.solver,
+            "max_flow": self.max_flow,
+            "phases": self.phases,
+            "augmentations": self.augmentations,
+            "arc_scans": self.arc_scans,
+            "max_level": self.max_level,
+            "phase_times": list(self.phase_times),
+            "wall_time": self.wall_time,
+            "peak_memory": self.peak_memory,
+        }
+
 class Graph:
-    def __init__(self, nodes: Dict[str, Node]) -> None:
+    def __init__(self, nodes: Dict[str, Node], directed: bool = False) -> None:
         self.nodes = nodes
+        self.directed = directed  # Default for Graph.add_edge
         self.level = {}  # Stores the level graph for BFS
+        self.level_source: Optional[Node] = None  # Source of self.level while the flows are unchanged
+        self.current_arc: Dict[Node, int] = {}  # Current-arc indices of the last blocking flow
+        self.blocking_scans = 0  # Edges examined by the DFS of the last blocking flow
+        self.parent_map: Dict[Node, Edge] = {}  # BFS tree of the last bfs call
+        self._fingerprint: Optional[int] = None  # Computed on first use, then kept up to date
+        self._arrays = None  # (fingerprint, CSRGraph) snapshot shared by query calls
+        for node in nodes.values():
+            node.graph = self
+
+    def add_edge(self, source: Node, target: Node, capacity: float, cost: float = 0) -> None:
+        """
+        Adds an edge following the graph's directed setting.
+        """
+        self.level_source = None
+        source.add_edge(target, capacity, self.directed, cost)
+
+    @property
+    def fingerprint(self) -> int:
+        """
+        64-bit order-independent hash of every residual edge's (tail, target, capacity),
+        computed once and then updated incrementally by add_edge and update_capacities.
+        Graphs with the same node names and capacities share a fingerprint. Assigning
+        Edge.capacity directly bypasses the update.
+        """
+        if self._fingerprint is None:
+            fingerprint = 0
+            for node in self.nodes.values():
+                node.graph = self
+                for edge in node.edges:
+                    fingerprint += hash((node.name, edge.target.name, edge.capacity))
+            self._fingerprint = fingerprint & FINGERPRINT_MASK
+        return self._fingerprint
+
+    def _track_capacity(self, tail: Node, edge: Edge, old_capacity: Optional[float]) -> None:
+        """
+        Moves the fingerprint from the edge's old capacity (None for a new edge) to its current one.
+        """
+        if self._fingerprint is None:
+            return
+        delta = hash((tail.name, edge.target.name, edge.capacity))
+        if old_capacity is not None:
+            delta -= hash((tail.name, edge.target.name, old_capacity))
+        self._fingerprint = (self._fingerprint + delta) & FINGERPRINT_MASK
 
-    def dinic_bfs(self, source: Node, sink: Node) -> bool:
+    def dinic_bfs(self, source: Node, sink: Node, threshold: float = 0) -> bool:
         """
         BFS to construct the level graph and check if a path exists from source to sink.
+        Only edges with more than threshold residual capacity are used.
         """
         self.level = {node: -1 for node in self.nodes.values()}  # Reset levels
+        self.level_source = source if threshold == 0 else None
         queue = deque([source])
         self.level[source] = 0
 
         while queue:
             current = queue.popleft()
             for edge in current.edges:
-                if self.level[edge.target] == -1 and edge.flow < edge.capacity:  # Not visited and has residual capacity
+                if self.level[edge.target] == -1 and edge.capacity - edge.flow > threshold:  # Not visited and has residual capacity
                     self.level[edge.target] = self.level[current] + 1
                     queue.append(edge.target)
 
         return self.level[sink] != -1  # True if sink is reachable
 
-    def dinic_dfs(self, current: Node, sink: Node, flow: float) -> float:
+    def dinic_blocking_flow(self, source: Node, sink: Node, observer: Optional[SolverObserver] = None,
+                            limit: Optional[float] = None, threshold: float = 0) -> float:
         """
-        DFS to send flow from source to sink in the level graph.
+        Iterative DFS that saturates the level graph. Every node keeps a current-arc
+        index, so edges that are saturated or lead to dead ends are never rescanned,
+        and after an augmentation the search resumes from the first saturated edge.
+        Stops once limit units have been pushed, if given. Edges count as saturated
+        once their residual capacity drops to threshold.
         """
-        if current == sink:
-            return flow
+        level = self.level
+        self.level_source = None
+        current_arc = self.current_arc = dict.fromkeys(level, 0)
+        path: List[Edge] = []  # Edges from source to current
+        total = 0
+        scans = 0  # Tallied per step rather than per edge, for SolverStats
+        current = source
 
-        for edge in current.edges:
-            residual_capacity = edge.capacity - edge.flow
-            if self.level[edge.target] == self.level[current] + 1 and residual_capacity > 0:
-                bottleneck_flow = self.dinic_dfs(edge.target, sink, min(flow, residual_capacity))
+        while True:
+            if current == sink:
+                bottleneck = min(edge.capacity - edge.flow for edge in path)
+                if limit is not None:
+                    bottleneck = min(bottleneck, limit - total)
+                for edge in path:
+                    edge.flow += bottleneck
+                    edge.reverse.flow -= bottleneck
+                total += bottleneck
+                if observer is not None:
+                    observer.path_augmented(self, bottleneck, [source] + [edge.target for edge in path])
+                if limit is not None and total >= limit:
+                    self.blocking_scans = scans
+                    return total
 
-                if bottleneck_flow > 0:
-                    edge.flow += bottleneck_flow
-                    edge.reverse.flow -= bottleneck_flow
-                    return bottleneck_flow
-        return 0
-    
-    def dinic_dfs_demo(self, current: Node, sink: Node, flow: float) -> tuple[float, List[Node]]:
-        """
-        DFS to send flow from source to sink in the level graph.
-        """
-        if current == sink:
-            return flow, [current]
+                # Retreat to the tail of the first saturated edge
+                for i, edge in enumerate(path):
+                    if edge.capacity - edge.flow <= threshold:
+                        break
+                del path[i:]
+                current = path[-1].target if path else source
+                continue
 
-        for edge in current.edges:
-            residual_capacity = edge.capacity - edge.flow
-            if self.level[edge.target] == self.level[current] + 1 and residual_capacity > 0:
-                bottleneck_flow, nodes = self.dinic_dfs_demo(edge.target, sink, min(flow, residual_capacity))
+            edges = current.edges
+            next_level = level[current] + 1
+            start = i = current_arc[current]
+            while i < len(edges):
+                edge = edges[i]
+                if level[edge.target] == next_level and edge.capacity - edge.flow > threshold:
+                    break
+                i += 1
+            current_arc[current] = i
 
-                if bottleneck_flow > 0:
-                    edge.flow += bottleneck_flow
-                    edge.reverse.flow -= bottleneck_flow
-                    return bottleneck_flow, [current] + nodes 
-        return 0, []
+            if i < len(edges):
+                scans += i - start + 1  # Including the edge stepped along
+                path.append(edges[i])
+                current = edges[i].target
+            else:
+                scans += i - start
+                if path:  # Dead end: drop the edge leading here
+                    current = path.pop().reverse.target
+                    current_arc[current] += 1
+                else:
+                    self.blocking_scans = scans
+                    return total
 
-    def dinic(self, source: Node, sink: Node) -> float:
+    def dinic(self, source: Node, sink: Node, observer: Optional[SolverObserver] = None,
+              limit: Optional[float] = None, threshold: float = 0) -> float:
         """
-        Dinic's algorithm implementation.
+        Dinic's algorithm implementation. With limit, stops as soon as limit units
+        have been added to the flow. With threshold, only augments along edges with
+        more than threshold residual capacity (one phase of dinic_scaling).
         """
         max_flow = 0
+        phase = 1
 
-        while self.dinic_bfs(source, sink):  # Construct level graph
-            flow = float('inf')
-            while flow:
-                flow = self.dinic_dfs(source, sink, float('inf'))
-                max_flow += flow
+        while (limit is None or max_flow < limit) and self.dinic_bfs(source, sink, threshold):  # Construct level graph
+            if observer is not None:
+                observer.phase_started(self, phase)
+                observer.level_graph_built(self, self.level)
+            max_flow += self.dinic_blocking_flow(source, sink, observer, None if limit is None else limit - max_flow,
+                                                 threshold)
+            if observer is not None:
+                observer.phase_finished(self, phase, max_flow)
+            phase += 1
 
         return max_flow
     
-    def dinic_demo(self, source: Node, sink: Node) -> float:
+    def level_cut_capacity(self, sink: Node) -> float:
         """
-        Dinic's algorithm implementation.
+        Residual capacity of the tightest cut between consecutive levels of the last
+        dinic_bfs: every residual edge leaving levels 0 .. k-1 ends at level k, so each
+        k up to the sink's level gives a source-sink cut. The current flow plus this
+        value bounds the maximum flow.
         """
-        max_flow = 0
-        step = 1
+        level = self.level
+        depth = level[sink]
+        if depth == -1:
+            return 0
+        layers = [0] * (depth + 1)  # layers[k]: residual capacity from level k - 1 to level k
+        for node, k in level.items():
+            if 0 <= k < depth:
+                for edge in node.edges:
+                    if level[edge.target] == k + 1:
+                        layers[k + 1] += edge.capacity - edge.flow
+        return min(layers[1:])
 
-        while self.dinic_bfs(source, sink):  # Construct level graph
-            print(f"Step {step}")
-            print(f"Level Graph", self.level)
+    def bounded_dinic(self, source: Node, sink: Node, time_limit: Optional[float] = None,
+                      max_phases: Optional[int] = None, target: Optional[float] = None) -> BoundedFlow:
+        """
+        Dinic from the current flow that stops early: once the flow reaches target, after
+        max_phases phases, or when time_limit seconds have passed (checked between phases).
+        Returns the flow reached and an upper bound from the level cut of the last BFS;
+        the two are equal when the flow is maximum.
+        """
+        deadline = None if time_limit is None else time.perf_counter() + time_limit
+        flow = self.flow_value(source)
+        phases = 0
 
-            flow = float('inf')
-            while flow:
-                flow, nodes = self.dinic_dfs_demo(source, sink, float('inf'))
-                print(f" Found Flow {flow}", nodes)
-                max_flow += flow
-            print(f" Stopping Flow reached, new max flow: {max_flow}")
+        while self.dinic_bfs(source, sink):
+            if ((target is not None and flow >= target) or (max_phases is not None and phases >= max_phases)
+                    or (deadline is not None and time.perf_counter() >= deadline)):
+                return BoundedFlow(flow, flow + self.level_cut_capacity(sink), phases)
+            flow += self.dinic_blocking_flow(source, sink, limit=None if target is None else target - flow)
+            phases += 1
 
-            step += 1
+        return BoundedFlow(flow, flow, phases)
 
-        return max_flow
+    def flow_at_least(self, source: Node, sink: Node, amount: float) -> bool:
+        """
+        Whether amount units can flow from source to sink. Augments the current flow
+        only until it reaches amount.
+        """
+        needed = amount - self.flow_value(source)
+        return needed <= 0 or self.dinic(source, sink, limit=needed) >= needed
 
-    def bfs(self, source: Node, sink: Node) -> Optional[Dict[Node, Edge]]:
+    def dinic_demo(self, source: Node, sink: Node) -> float:
+        """
+        Dinic's algorithm, printing every phase and augmenting path.
         """
-        Perform BFS to find an augmenting path from source to sink.
+        return self.dinic(source, sink, DinicPrinter())
+
+    def bfs(self, source: Node, sink: Node, threshold: float = 0) -> Optional[Dict[Node, Edge]]:
+        """
+        Perform BFS to find an augmenting path from source to sink, using only edges
+        with more than threshold residual capacity.
         Returns a dictionary mapping each node to the edge used to reach it,
         or None if no path exists.
         """
-        parent_map = {}
+        parent_map = self.parent_map = {}
         queue = deque([source])
 
         while queue:
@@ -141,7 +455,7 @@ class Graph:
 
             for edge in current.edges:
                 residual_capacity = edge.capacity - edge.flow
-                if edge.target not in parent_map and residual_capacity > 0:
+                if edge.target not in parent_map and residual_capacity > threshold:
                     parent_map[edge.target] = edge
                     if edge.target == sink:
                         return parent_map
@@ -149,17 +463,27 @@ class Graph:
 
         return None
 
-    def edmonds_karp(self, source: Node, sink: Node) -> float:
+    def edmonds_karp(self, source: Node, sink: Node, observer: Optional[SolverObserver] = None,
+                     limit: Optional[float] = None, threshold: float = 0) -> float:
+        """
+        Edmonds-Karp implementation. With limit, stops as soon as limit units have been
+        added to the flow. With threshold, only augments along edges with more than
+        threshold residual capacity (one phase of edmonds_karp_scaling).
+        """
+        self.level_source = None
         max_flow = 0
+        step = 1
 
-        while True:
+        while limit is None or max_flow < limit:
             # Find an augmenting path using BFS
-            parent_map = self.bfs(source, sink)
+            parent_map = self.bfs(source, sink, threshold)
             if not parent_map:  # No more augmenting paths
                 break
+            if observer is not None:
+                observer.phase_started(self, step)
 
             # Calculate bottleneck capacity (minimum residual capacity on the path)
-            path_flow = float('inf')
+            path_flow = float('inf') if limit is None else limit - max_flow
             current = sink
             while current != source:
                 edge = parent_map[current]
@@ -177,122 +501,614 @@ class Graph:
             # Add path flow to max flow
             max_flow += path_flow
 
+            if observer is not None:
+                path = [sink]
+                while path[-1] != source:
+                    path.append(parent_map[path[-1]].reverse.target)
+                path.reverse()
+                observer.path_augmented(self, path_flow, path)
+                observer.phase_finished(self, step, max_flow)
+            step += 1
+
         return max_flow
     
+    def scaling_thresholds(self, source: Node, sink: Node) -> Iterator[float]:
+        """
+        Thresholds of the capacity-scaling phases: powers of two from the largest one
+        below the widest possible bottleneck (the smaller of the widest residual edge
+        leaving the source and entering the sink) down to 1, then 0 for whatever
+        residual is left.
+        """
+        widest = min(max((edge.capacity - edge.flow for edge in source.edges), default=0),
+                     max((edge.reverse.capacity - edge.reverse.flow for edge in sink.edges), default=0))
+        threshold = 1
+        while threshold * 2 < widest:
+            threshold *= 2
+        while threshold >= 1:
+            yield threshold
+            threshold //= 2
+        yield 0
+
+    def edmonds_karp_scaling(self, source: Node, sink: Node) -> float:
+        """
+        Capacity-scaling Edmonds-Karp: each phase only augments along paths whose
+        bottleneck exceeds the phase threshold, so wide capacity ranges take
+        O(E log U) augmentations instead of wasting them on tiny paths.
+        """
+        return sum(self.edmonds_karp(source, sink, threshold=threshold)
+                   for threshold in self.scaling_thresholds(source, sink))
+
+    def dinic_scaling(self, source: Node, sink: Node) -> float:
+        """
+        Capacity-scaling Dinic: dinic restricted to edges with residual capacity above
+        each threshold of scaling_thresholds in turn.
+        """
+        return sum(self.dinic(source, sink, threshold=threshold) for threshold in self.scaling_thresholds(source, sink))
+
+    def push_relabel(self, source: Node, sink: Node) -> float:
+        """
+        Highest-label push-relabel with the gap heuristic and periodic global relabeling
+        (a reverse BFS from the sink). A second pass returns the excess that cannot reach
+        the sink to the source, so Edge.flow holds a valid flow afterwards.
+        """
+        self.level_source = None
+        nodes = list(self.nodes.values())
+        n = len(nodes)
+        excess = {node: -sum(edge.flow for edge in node.edges) for node in nodes}  # Net inflow
+        initial_flow = excess[sink]
+        height = dict.fromkeys(nodes, n)
+        current_arc = dict.fromkeys(nodes, 0)
+        layers = [set() for _ in range(n)]  # Nodes at each height below n
+        active = [[] for _ in range(n)]  # Nodes with excess at each height below n
+
+        # Saturate every edge leaving the source
+        for edge in source.edges:
+            residual = edge.capacity - edge.flow
+            if residual > 0:
+                edge.flow += residual
+                edge.reverse.flow -= residual
+                excess[edge.target] += residual
+                excess[source] -= residual
+
+        def global_relabel() -> int:
+            # Exact distances to the sink in the residual graph; unreachable nodes get n
+            for node in nodes:
+                height[node] = n
+                current_arc[node] = 0
+            height[sink] = 0
+            queue = deque([sink])
+            while queue:
+                current = queue.popleft()
+                for edge in current.edges:
+                    reverse = edge.reverse
+                    if height[edge.target] == n and edge.target is not source and reverse.capacity - reverse.flow > 0:
+                        height[edge.target] = height[current] + 1
+                        queue.append(edge.target)
+
+            for h in range(n):
+                layers[h].clear()
+                active[h].clear()
+            highest = 0
+            for node in nodes:
+                h = height[node]
+                if h < n:
+                    layers[h].add(node)
+                    if excess[node] > EXCESS_TOLERANCE and node is not sink:
+                        active[h].append(node)
+                        highest = max(highest, h)
+            return highest
+
+        # Phase 1: maximum preflow
+        highest = global_relabel()
+        relabels = 0
+        while highest >= 0:
+            if not active[highest]:
+                highest -= 1
+                continue
+            current = active[highest].pop()
+            h = height[current]
+            if h != highest or excess[current] <= EXCESS_TOLERANCE:  # Stale entry
+                continue
+
+            edges = current.edges
+            i = current_arc[current]
+            while True:
+                if i == len(edges):
+                    # Relabel
+                    relabels += 1
+                    layers[h].discard(current)
+                    if not layers[h]:
+                        # Gap: nothing above h can reach the sink any more
+                        for above in range(h + 1, n):
+                            for node in layers[above]:
+                                height[node] = n
+                            layers[above].clear()
+                        h = n
+                    else:
+                        h = min((height[edge.target] for edge in edges if edge.capacity - edge.flow > 0), default=n - 1) + 1
+                    height[current] = h
+                    i = 0
+                    if h >= n:
+                        break
+                    layers[h].add(current)
+                    continue
+
+                edge = edges[i]
+                residual = edge.capacity - edge.flow
+                if residual > 0 and h == height[edge.target] + 1:
+                    delta = min(excess[current], residual)
+                    edge.flow += delta
+                    edge.reverse.flow -= delta
+                    excess[current] -= delta
+                    if excess[edge.target] <= EXCESS_TOLERANCE and edge.target is not sink:
+                        active[h - 1].append(edge.target)
+                        if h - 1 > highest:  # current may sit above highest after a relabel
+                            highest = h - 1
+                    excess[edge.target] += delta
+                    if excess[current] <= EXCESS_TOLERANCE:
+                        break
+                else:
+                    i += 1
+
+            current_arc[current] = i
+            if h < n and h > highest:
+                highest = h
+            if relabels >= n:  # Periodic global relabel
+                relabels = 0
+                highest = global_relabel()
+
+        # Phase 2: return excess that cannot reach the sink to the source
+        for node in nodes:
+            height[node] = 2 * n
+            current_arc[node] = 0
+        height[source] = n
+        height[sink] = 0
+        queue = deque([source])
+        while queue:
+            current = queue.popleft()
+            for edge in current.edges:
+                reverse = edge.reverse
+                if height[edge.target] == 2 * n and reverse.capacity - reverse.flow > 0:
+                    height[edge.target] = height[current] + 1
+                    queue.append(edge.target)
+
+        queue = deque(node for node in nodes
+                      if excess[node] > EXCESS_TOLERANCE and node is not source and node is not sink)
+        while queue:
+            current = queue.popleft()
+            edges = current.edges
+            i = current_arc[current]
+            while excess[current] > EXCESS_TOLERANCE:
+                if i == len(edges):
+                    h = min((height[edge.target] for edge in edges if edge.capacity - edge.flow > 0), default=None)
+                    if h is None:  # No residual edge left: the excess is rounding error
+                        break
+                    height[current] = h + 1
+                    i = 0
+                    continue
+                edge = edges[i]
+                residual = edge.capacity - edge.flow
+                if residual > 0 and height[current] == height[edge.target] + 1:
+                    delta = min(excess[current], residual)
+                    edge.flow += delta
+                    edge.reverse.flow -= delta
+                    excess[current] -= delta
+                    if excess[edge.target] <= EXCESS_TOLERANCE and edge.target is not source and edge.target is not sink:
+                        queue.append(edge.target)
+                    excess[edge.target] += delta
+                else:
+                    i += 1
+            current_arc[current] = i
+
+        return excess[sink] - initial_flow
+
     def plot_graph(self, step: int) -> None:
         """
         Visualizes the graph after each step of augmentation.
-        Ensures unidirectional arrows and correct flow display.
+        networkx and matplotlib are imported on first use only.
         """
-        G = nx.DiGraph()  # Create a directed graph
+        if __package__:
+            from .visualization import plot_graph
+        else:
+            from visualization import plot_graph
+        plot_graph(self, step)
 
-        # Add nodes to the graph
-        for node in self.nodes.values():
-            G.add_node(node.name)
+    def edmonds_karp_demo(self, source: Node, sink: Node) -> float:
+        """
+        Edmonds-Karp, printing and plotting the graph after every augmentation.
+        """
+        return self.edmonds_karp(source, sink, EdmondsKarpPrinter())
 
-        # Add edges with capacity and flow as labels
+    def reset_calculated_flows(self):
+        #Reset Flows
+        self.level_source = None
         for node in self.nodes.values():
             for edge in node.edges:
-                if edge.capacity > 0:
-                    flow_label = f"Flow: {-edge.flow}"
-                    capacity_label = f"Capacity: {edge.capacity}"
-                    G.add_edge(node.name, edge.target.name, label=f"{capacity_label}\n{flow_label}")
-
-        # Draw the graph with custom settings
-        pos = nx.spring_layout(G, seed=1)  # Set positions for all nodes
-        plt.figure(figsize=(8, 6))
-        nx.draw(G, pos, with_labels=True, node_size=3000, node_color="lightblue", font_size=12, font_weight="bold", arrows=True)
-        
-        # Edge labels for capacity and flow
-        edge_labels = nx.get_edge_attributes(G, "label")
-        nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, font_size=10)
-
-        plt.title(f"Graph at Step {step}")
-        plt.show()
+                edge.flow = 0
 
-    def edmonds_karp_demo(self, source: Node, sink: Node) -> float:
-        max_flow = 0
-        step = 1
+    def min_cost_max_flow(self, source: Node, sink: Node, limit: Optional[float] = None) -> Tuple[float, float]:
+        """
+        Successive shortest paths: starting from zero flow, repeatedly augments along a
+        cheapest residual path, found with Dijkstra on costs reduced by node potentials
+        (which keeps them non-negative). Stops at the maximum flow, or at limit units.
+        Negative edge costs are allowed as long as there is no negative-cost cycle; the
+        initial potentials then come from Bellman-Ford. Returns (flow, cost).
+        """
+        self.reset_calculated_flows()
+        potential = self._initial_potentials()
+        flow = cost = 0
+        order = count()  # Heap tie-breaker, nodes do not compare
 
-        while True:
-            parent_map = self.bfs(source, sink)
-            if not parent_map:
+        while limit is None or flow < limit:
+            distance = {source: 0}
+            parent_map: Dict[Node, Edge] = {}
+            heap = [(0, next(order), source)]
+            while heap:
+                d, _, current = heappop(heap)
+                if d > distance[current]:
+                    continue
+                base = d + potential[current]
+                for edge in current.edges:
+                    if edge.capacity - edge.flow > 0:
+                        target = edge.target
+                        reduced = base + edge.cost - potential[target]
+                        if reduced < distance.get(target, float('inf')):
+                            distance[target] = reduced
+                            parent_map[target] = edge
+                            heappush(heap, (reduced, next(order), target))
+
+            if sink not in distance:
                 break
+            for node, d in distance.items():  # Unreached nodes stay unreachable
+                potential[node] += d
 
-            path_flow = float('inf')
+            path_flow = float('inf') if limit is None else limit - flow
             current = sink
-            augmenting_path = []
-
             while current != source:
                 edge = parent_map[current]
-                augmenting_path.append((edge.reverse.target.name, current.name))
                 path_flow = min(path_flow, edge.capacity - edge.flow)
                 current = edge.reverse.target
 
-            augmenting_path.reverse()
-
             current = sink
             while current != source:
                 edge = parent_map[current]
                 edge.flow += path_flow
                 edge.reverse.flow -= path_flow
+                cost += path_flow * edge.cost
                 current = edge.reverse.target
+            flow += path_flow
 
-            max_flow += path_flow
+        return flow, cost
 
-            print(f"\n=== Augmentation Step {step} ===")
-            print(f"Augmenting Path: {' -> '.join(node for node, _ in augmenting_path)} -> {sink.name}")
-            print(f"Bottleneck Capacity: {path_flow}")
-            print(f"Updated Flows:")
+    def _initial_potentials(self) -> Dict[Node, float]:
+        """
+        Zero potentials, or shortest-path distances from a virtual root joined to every
+        node (Bellman-Ford with a queue) when some residual edge has a negative cost.
+        """
+        nodes = list(self.nodes.values())
+        potential = dict.fromkeys(nodes, 0)
+        if all(edge.cost >= 0 or edge.capacity <= 0 for node in nodes for edge in node.edges):
+            return potential
 
-            for node in self.nodes.values():
-                for edge in node.edges:
-                    if edge.capacity > 0 and edge.flow>0:  # Only print forward edges
-                        print(f"  {node.name} -> {edge.target.name} | Capacity: {edge.capacity}, Flow: {edge.flow}")
+        queue = deque(nodes)
+        queued = set(nodes)
+        relaxations = 0
+        limit = len(nodes) * sum(len(node.edges) for node in nodes)
+        while queue:
+            current = queue.popleft()
+            queued.discard(current)
+            for edge in current.edges:
+                if edge.capacity - edge.flow > 0:
+                    d = potential[current] + edge.cost
+                    if d < potential[edge.target]:
+                        potential[edge.target] = d
+                        relaxations += 1
+                        if relaxations > limit:
+                            raise ValueError("The graph has a negative-cost cycle.")
+                        if edge.target not in queued:
+                            queued.add(edge.target)
+                            queue.append(edge.target)
+        return potential
 
-            self.plot_graph(step)
+    def flow_cost(self) -> float:
+        """
+        Total cost of the flow currently stored on the edges.
+        """
+        return sum(edge.flow * edge.cost for node in self.nodes.values() for edge in node.edges if edge.flow > 0)
 
-            step += 1
+    def flow_value(self, source: Node) -> float:
+        """
+        Net flow currently leaving the source.
+        """
+        return sum(edge.flow for edge in source.edges)
 
-        return max_flow
-    
-    def reset_calculated_flows(self):
-        #Reset Flows
+    def push_between(self, start: Node, end: Node, amount: float) -> float:
+        """
+        Pushes up to amount units from start to end along residual paths.
+        Returns how much was pushed.
+        """
+        self.level_source = None
+        pushed = 0
+        while pushed < amount:
+            parent_map = self.bfs(start, end)
+            if not parent_map:
+                break
+
+            path_flow = amount - pushed
+            current = end
+            while current != start:
+                edge = parent_map[current]
+                path_flow = min(path_flow, edge.capacity - edge.flow)
+                current = edge.reverse.target
+
+            current = end
+            while current != start:
+                edge = parent_map[current]
+                edge.flow += path_flow
+                edge.reverse.flow -= path_flow
+                current = edge.reverse.target
+
+            pushed += path_flow
+
+        return pushed
+
+    def update_capacity(self, edge: Edge, capacity: float, source: Node, sink: Node) -> float:
+        """
+        Changes the capacity of a single edge and updates the current flow.
+        See update_capacities.
+        """
+        return self.update_capacities([(edge, capacity)], source, sink)
+
+    def update_capacities(self, changes: Iterable[Tuple[Edge, float]], source: Node, sink: Node) -> float:
+        """
+        Changes edge capacities and updates the maximum flow stored on the edges,
+        starting from the current flow instead of recomputing it from scratch.
+        Only the given edge is changed, not its reverse edge.
+
+        An edge whose flow exceeds its new capacity is repaired locally: the overflow
+        is first rerouted around the edge, and only what cannot be rerouted is
+        cancelled back to the terminals. Returns the new maximum flow value.
+        """
+        self.level_source = None
+        changes = list(changes)
+        for edge, capacity in changes:
+            old_capacity = edge.capacity
+            edge.capacity = capacity
+            self._track_capacity(edge.reverse.target, edge, old_capacity)
+
+        may_augment = False
+        for edge, capacity in changes:
+            overflow = edge.flow - edge.capacity
+            if overflow <= 0:
+                may_augment = True  # Increased (or untouched) capacity can admit new paths
+                continue
+
+            tail, head = edge.reverse.target, edge.target
+            edge.flow = edge.capacity
+            edge.reverse.flow = -edge.capacity
+
+            # tail now has excess and head a deficit; try to route around the edge first
+            remaining = overflow - self.push_between(tail, head, overflow)
+            if remaining <= 0:
+                continue
+            may_augment = True
+
+            # Return what is left at tail to a terminal and refill head from one
+            if tail is not source and tail is not sink:
+                left = remaining - self.push_between(tail, source, remaining)
+                if left > 0:
+                    self.push_between(tail, sink, left)
+            if head is not source and head is not sink:
+                left = remaining - self.push_between(sink, head, remaining)
+                if left > 0:
+                    self.push_between(source, head, left)
+
+        if may_augment:
+            self.dinic(source, sink)  # Augments from the current flow
+        return self.flow_value(source)
+
+    def edge_pairs(self) -> Iterator[Tuple[Node, Edge]]:
+        """
+        Yields every edge/reverse-edge pair once, as (tail, edge) for whichever edge of the
+        pair comes first in node order.
+        """
+        seen = set()
         for node in self.nodes.values():
             for edge in node.edges:
-                edge.flow = 0
+                if edge.reverse in seen:
+                    seen.discard(edge.reverse)
+                else:
+                    seen.add(edge)
+                    yield node, edge
+
+    def residual_reachable(self, source: Node) -> Set[Node]:
+        """
+        Nodes reachable from source through edges with residual capacity.
+        Reuses the level graph of the last dinic_bfs when the flows have not changed since.
+        """
+        if self.level_source is not source:
+            self.dinic_bfs(source, source)
+        return {node for node, level in self.level.items() if level != -1}
+
+    def min_cut(self, source: Node, sink: Node) -> MinCut:
+        """
+        Minimum cut of the maximum flow currently stored on the edges, read off the
+        residual graph. Right after dinic this needs no extra traversal, since its final
+        BFS already is the residual reachability from the source.
+        """
+        source_side = self.residual_reachable(source)
+        if sink in source_side:
+            raise ValueError("The current flow is not maximum, run a max-flow solver first.")
+
+        edges = [edge for node in source_side for edge in node.edges
+                 if edge.target not in source_side and edge.capacity > 0]
+        return MinCut(source_side, edges, sum(edge.capacity for edge in edges))
+
+    def profile(self, solver: str, source: Node, sink: Node, trace_memory: bool = True) -> Tuple[float, SolverStats]:
+        """
+        Runs "dinic" or "edmonds_karp" with a SolverStats observer attached and returns
+        the max flow together with the stats.
+        """
+        if solver not in ("dinic", "edmonds_karp"):
+            raise ValueError(f"Profiling supports dinic and edmonds_karp, not {solver!r}")
+        stats = SolverStats(solver, source, sink)
+        stats.start(trace_memory)
+        max_flow = getattr(self, solver)(source, sink, stats)
+        stats.finish(self, max_flow)
+        return max_flow, stats
+
+    def multi_terminal_flow(self, sources: Union[Iterable[Node], Dict[Node, float]],
+                            sinks: Union[Iterable[Node], Dict[Node, float]]) -> float:
+        """
+        Maximum flow from a set of sources into a set of sinks, optionally limited per
+        terminal: pass a dict mapping each source to its supply and each sink to its
+        demand instead of a plain iterable. Solved in a single dinic run on arrays with a
+        super source and super sink added, so no Node adjacency list is modified. Replaces
+        the flows on the edges with the result.
+        """
+        sources = dict(sources) if isinstance(sources, dict) else dict.fromkeys(sources, float('inf'))
+        sinks = dict(sinks) if isinstance(sinks, dict) else dict.fromkeys(sinks, float('inf'))
+        if not sources.keys().isdisjoint(sinks):
+            raise ValueError("A node cannot be both a source and a sink.")
+        if __package__:
+            from .csr import CSRGraph
+        else:
+            from csr import CSRGraph
+
+        nodes = list(self.nodes.values())
+        index = {node: i for i, node in enumerate(nodes)}
+        super_source, super_sink = len(nodes), len(nodes) + 1
+        tails, heads = array('q'), array('q')
+        capacities, reverse_capacities = array('d'), array('d')
+        edges = []
+        for tail, edge in self.edge_pairs():
+            tails.append(index[tail])
+            heads.append(index[edge.target])
+            capacities.append(edge.capacity)
+            reverse_capacities.append(edge.reverse.capacity)
+            edges.append(edge)
+        for node, supply in sources.items():
+            tails.append(super_source)
+            heads.append(index[node])
+            capacities.append(supply)
+            reverse_capacities.append(0)
+        for node, demand in sinks.items():
+            tails.append(index[node])
+            heads.append(super_sink)
+            capacities.append(demand)
+            reverse_capacities.append(0)
+
+        csr = CSRGraph.from_arrays(len(nodes) + 2, tails, heads, capacities, reverse_capacities)
+        max_flow = csr.dinic(super_source, super_sink)
+
+        self.level_source = None
+        flow, pair_arcs = csr.flow, csr.pair_arcs
+        for i, edge in enumerate(edges):
+            edge.flow = flow[pair_arcs[i]]
+            edge.reverse.flow = -edge.flow
+        return max_flow
+
+    def decompose_flow(self, source: Node, sink: Node, cycles: bool = False) -> Iterator[Tuple[float, List[Node]]]:
+        """
+        Lazily splits the flow stored on the edges into (amount, path) pairs of source-sink
+        paths. Cycles in the flow are cancelled, or also yielded with cycles=True (the path
+        then starts and ends at the same node). Runs on arc arrays copied from the edges,
+        see CSRGraph.decompose_flow; the edges are left untouched.
+        """
+        if __package__:
+            from .csr import CSRGraph
+        else:
+            from csr import CSRGraph
+        nodes = list(self.nodes.values())
+        csr = CSRGraph.from_graph(self)
+        for amount, path in csr.decompose_flow(nodes.index(source), nodes.index(sink), cycles):
+            yield amount, [nodes[u] for u in path]
+
+    def snapshot(self) -> CSRGraph:
+        """
+        Read-only CSRGraph copy of the graph with zero flows, cached and rebuilt when the
+        fingerprint changes. Solve on snapshot().workspace(), never on the snapshot itself.
+        """
+        fingerprint = self.fingerprint
+        arrays = self._arrays
+        if arrays is None or arrays[0] != fingerprint:
+            if __package__:
+                from .csr import CSRGraph
+            else:
+                from csr import CSRGraph
+            csr = CSRGraph.from_graph(self)
+            csr.reset_calculated_flows()
+            arrays = self._arrays = (fingerprint, csr)
+        return arrays[1]
+
+    def query(self, source: Node, sink: Node, solver: str = "dinic") -> float:
+        """
+        Max flow computed in a private workspace over the shared snapshot(); Edge.flow and
+        the level graph are left untouched, and no reset is needed. Several threads can
+        query the same graph at once. solver is "dinic" or "edmonds_karp".
+        """
+        if solver not in ("dinic", "edmonds_karp"):
+            raise ValueError(f"Queries support dinic and edmonds_karp, not {solver!r}")
+        return getattr(self.snapshot().workspace(), solver)(source, sink)
+
+    def generate_random_graph(num_nodes: int, num_edges: int, max_edge_capacity: int = 10, directed: bool = False,
+                              seed: Optional[int] = None) -> Graph:
+        """
+        Random connected graph: a random spanning path plus random extra edges, built in
+        O(V + E). See generate_random_edges.
+        """
+        tails, heads, capacities = generate_random_edges(num_nodes, num_edges, max_edge_capacity, seed)
+        node_list = [Node(f"Node{i}") for i in range(num_nodes)]
+        for u, v, capacity in zip(tails, heads, capacities):
+            node_list[u].add_edge(node_list[v], capacity, directed)
+
+        return Graph({node.name: node for node in node_list}, directed)
+
+SOLVERS = ("edmonds_karp", "dinic", "push_relabel", "edmonds_karp_scaling", "dinic_scaling")  # Graph methods with the (source, sink) -> float signature
+
+def generate_random_edges(num_nodes: int, num_edges: int, max_edge_capacity: int = 10,
+                          seed: Optional[int] = None) -> Tuple[array, array, array]:
+    """
+    Random connected edge list over nodes 0 .. num_nodes - 1 as (tails, heads, capacities)
+    columns: a random spanning path plus random extra edges, no two edges joining the
+    same pair of nodes. Runs in O(V + E); without a seed the global random state is used.
+    """
+    if num_edges < num_nodes - 1:
+        raise ValueError("Number of edges must be at least num_nodes - 1 to ensure connectivity.")
+    max_pairs = num_nodes * (num_nodes - 1) // 2
+    if num_edges > max_pairs:
+        raise ValueError("Number of edges exceeds the number of node pairs.")
+    rng = random if seed is None else random.Random(seed)
+
+    # Step 1: Spanning path through the nodes in random order
+    order = list(range(num_nodes))
+    rng.shuffle(order)
+    tails = array('q', order[:-1])
+    heads = array('q', order[1:])
+    used = {min(u, v) * num_nodes + max(u, v) for u, v in zip(tails, heads)}
+
+    # Step 2: Add additional random edges to meet num_edges
+    missing = num_edges - len(tails)
+    if missing > (max_pairs - len(used)) // 2:
+        # Dense target: sample straight from the unused pairs instead of rejecting
+        free = [u * num_nodes + v for u in range(num_nodes) for v in range(u + 1, num_nodes)
+                if u * num_nodes + v not in used]
+        for key in rng.sample(free, missing):
+            u, v = divmod(key, num_nodes)
+            if rng.random() < 0.5:
+                u, v = v, u
+            tails.append(u)
+            heads.append(v)
+    else:
+        nodes = range(num_nodes)
+        while missing:
+            for u, v in zip(rng.choices(nodes, k=missing), rng.choices(nodes, k=missing)):
+                key = u * num_nodes + v if u < v else v * num_nodes + u
+                if u != v and key not in used:  # Avoid duplicates
+                    used.add(key)
+                    tails.append(u)
+                    heads.append(v)
+                    missing -= 1
 
-    def generate_random_graph(num_nodes: int, num_edges: int, max_edge_capacity: int = 10) -> Graph:
-        if num_edges < num_nodes - 1:
-            raise ValueError("Number of edges must be at least num_nodes - 1 to ensure connectivity.")
-
-        nodes = {f"Node{i}": Node(f"Node{i}") for i in range(num_nodes)}
-        edges = set()
-        node_list = list(nodes.values())
-
-        unconnected = set(node_list)
-        connected = set()
-
-        current = unconnected.pop()
-        connected.add(current)
-
-        while unconnected:
-            # Connect a random connected node to an unconnected node
-            target = random.choice(list(unconnected))
-            capacity = random.randint(1, max_edge_capacity)
-            current.add_edge(target, capacity)
-            edges.add((current, target))
-            unconnected.remove(target)
-            connected.add(target)
-            current = target  # Move to the newly connected node
-
-        # Step 2: Add additional random edges to meet num_edges
-        while len(edges) < num_edges:
-            u = random.choice(node_list)
-            v = random.choice(node_list)
-            if u != v and (u, v) not in edges and (v, u) not in edges:  # Avoid duplicates
-                capacity = random.randint(1, max_edge_capacity)
-                u.add_edge(v, capacity)
-                edges.add((u, v))
-
-        return Graph(nodes)
+    capacities = array('q', rng.choices(range(1, max_edge_capacity + 1), k=num_edges))
+    return tails, heads, capacities
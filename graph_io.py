@@ -0,0 +1,177 @@
+"""
+Streaming readers and writers for DIMACS max-flow (.max) and CSV edge-list files.
+
+Readers go through the file in fixed-size binary chunks and append every arc straight
+into flat arrays, which are then laid out as a CSRGraph; no per-line objects outlive
+the line being parsed. Call .to_graph() on the result for Node/Edge objects.
+
+Both formats describe directed arcs. Writers emit every residual edge with a positive
+capacity, so an undirected Graph comes back as two opposite directed arcs per edge,
+with the same max-flow values.
+"""
+from __future__ import annotations
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    from .graph import Graph, Node
+    from .csr import CSRGraph
+except ImportError:  # imported as a top-level script module
+    from graph import Graph, Node
+    from csr import CSRGraph
+
+CHUNK_SIZE = 1 << 20
+WRITE_BATCH = 1 << 16  # Lines per write call
+
+
+def _lines(file, chunk_size: int) -> Iterator[bytes]:
+    """
+    Lines of a binary file, read chunk_size bytes at a time.
+    """
+    rest = b""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        lines = (rest + chunk).split(b"\n")
+        rest = lines.pop()
+        yield from lines
+    if rest:
+        yield rest
+
+
+def _build(num_nodes: int, tails: array, heads: array, capacities: array, directed: bool,
+           names: Optional[List[str]] = None) -> CSRGraph:
+    reverse_capacities = array('d', bytes(8 * len(capacities))) if directed else capacities
+    graph = CSRGraph.from_arrays(num_nodes, tails, heads, capacities, reverse_capacities, names)
+    graph.directed = directed
+    return graph
+
+
+def read_dimacs(path: str, directed: bool = True, chunk_size: int = CHUNK_SIZE) -> Tuple[CSRGraph, int, int]:
+    """
+    Reads a DIMACS max-flow file and returns (graph, source, sink). DIMACS node ids
+    start at 1; the returned graph uses 0-based indices.
+    """
+    tails = array('q')
+    heads = array('q')
+    capacities = array('d')
+    num_nodes = source = sink = None
+
+    with open(path, "rb") as file:
+        for number, line in enumerate(_lines(file, chunk_size), 1):
+            kind = line[:1]
+            if kind == b"a":
+                _, u, v, capacity = line.split()
+                tails.append(int(u) - 1)
+                heads.append(int(v) - 1)
+                capacities.append(float(capacity))
+            elif kind == b"n":
+                _, node, role = line.split()
+                if role == b"s":
+                    source = int(node) - 1
+                elif role == b"t":
+                    sink = int(node) - 1
+            elif kind == b"p":
+                _, problem, nodes, _ = line.split()
+                if problem != b"max":
+                    raise ValueError(f"{path}:{number}: expected a max-flow problem, got {problem.decode()!r}")
+                num_nodes = int(nodes)
+            elif kind not in (b"c", b"", b"\r"):
+                raise ValueError(f"{path}:{number}: unexpected line {line[:40]!r}")
+
+    if num_nodes is None or source is None or sink is None:
+        raise ValueError(f"{path}: missing problem, source or sink line")
+    return _build(num_nodes, tails, heads, capacities, directed), source, sink
+
+
+def read_edge_list(path: str, directed: bool = True, delimiter: str = ",",
+                   chunk_size: int = CHUNK_SIZE) -> CSRGraph:
+    """
+    Reads "tail,head,capacity" lines. Node labels are arbitrary strings and become the
+    node names, numbered in order of first appearance. A header line is skipped.
+    """
+    separator = delimiter.encode()
+    index: Dict[bytes, int] = {}
+    tails = array('q')
+    heads = array('q')
+    capacities = array('d')
+
+    with open(path, "rb") as file:
+        for number, line in enumerate(_lines(file, chunk_size), 1):
+            line = line.strip()
+            if not line or line[:1] == b"#":
+                continue
+            u, v, capacity = line.split(separator)
+            try:
+                capacities.append(float(capacity))
+            except ValueError:
+                if number == 1:  # Header
+                    continue
+                raise ValueError(f"{path}:{number}: bad capacity {capacity!r}")
+            tails.append(index.setdefault(u.strip(), len(index)))
+            heads.append(index.setdefault(v.strip(), len(index)))
+
+    names = [label.decode() for label in index]
+    return _build(len(names), tails, heads, capacities, directed, names)
+
+
+def _arcs(graph: Union[Graph, CSRGraph]) -> Iterator[Tuple[int, int, float]]:
+    """
+    Every residual arc with positive capacity as (tail index, head index, capacity).
+    """
+    if isinstance(graph, CSRGraph):
+        offsets, heads, capacity = graph.offsets, graph.heads, graph.capacity
+        for u in range(graph.num_nodes):
+            for a in range(offsets[u], offsets[u + 1]):
+                if capacity[a] > 0:
+                    yield u, heads[a], capacity[a]
+    else:
+        index = {node: i for i, node in enumerate(graph.nodes.values())}
+        for tail, edge in graph.edge_pairs():
+            if edge.capacity > 0:
+                yield index[tail], index[edge.target], edge.capacity
+            if edge.reverse.capacity > 0:
+                yield index[edge.target], index[tail], edge.reverse.capacity
+
+
+def _format(capacity: float) -> str:
+    return str(int(capacity)) if capacity == int(capacity) else repr(capacity)
+
+
+def _write_lines(file, lines: Iterator[str]) -> None:
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) == WRITE_BATCH:
+            file.write("\n".join(batch) + "\n")
+            batch.clear()
+    if batch:
+        file.write("\n".join(batch) + "\n")
+
+
+def write_dimacs(graph: Union[Graph, CSRGraph], path: str, source: Union[int, Node], sink: Union[int, Node]) -> None:
+    if isinstance(graph, CSRGraph):
+        num_nodes = graph.num_nodes
+        source, sink = graph.node_index(source), graph.node_index(sink)
+    else:
+        nodes = list(graph.nodes.values())
+        num_nodes = len(nodes)
+        source, sink = nodes.index(source), nodes.index(sink)
+
+    num_arcs = sum(1 for _ in _arcs(graph))
+    with open(path, "w") as file:
+        file.write(f"p max {num_nodes} {num_arcs}\nn {source + 1} s\nn {sink + 1} t\n")
+        _write_lines(file, (f"a {u + 1} {v + 1} {_format(capacity)}" for u, v, capacity in _arcs(graph)))
+
+
+def write_edge_list(graph: Union[Graph, CSRGraph], path: str, delimiter: str = ",") -> None:
+    if isinstance(graph, CSRGraph):
+        names = graph.names if graph.names is not None else [str(u) for u in range(graph.num_nodes)]
+    else:
+        names = [node.name for node in graph.nodes.values()]
+
+    with open(path, "w") as file:
+        file.write(delimiter.join(["tail", "head", "capacity"]) + "\n")
+        _write_lines(file, (delimiter.join([names[u], names[v], _format(capacity)])
+                            for u, v, capacity in _arcs(graph)))
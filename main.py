@@ -53,6 +53,7 @@ def measure_runtime_vs_maxflow_E():
     plt.show()
 
 # Run the function to measure runtime and plot
-measure_runtime_vs_maxflow_E()
+if __name__ == "__main__":
+    measure_runtime_vs_maxflow_E()
 
 # test_complex_graph()
\ No newline at end of file
@@ -0,0 +1,125 @@
+from __future__ import annotations
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, Mapping, Set
+
+try:
+    from .graph import Graph, Node
+except ImportError:  # imported as a top-level script module
+    from graph import Graph, Node
+
+
+class Matching:
+    def __init__(self, pairs: Dict[Hashable, Hashable], left_cover: Set[Hashable],
+                 right_cover: Set[Hashable]) -> None:
+        self.pairs = pairs  # Left vertex -> matched right vertex
+        self.left_cover = left_cover  # Minimum vertex cover (König), left part
+        self.right_cover = right_cover  # ... and right part; len(left_cover) + len(right_cover) == size
+
+    @property
+    def size(self) -> int:
+        return len(self.pairs)
+
+    def __repr__(self): return f"Matching of size {self.size}"
+
+
+def hopcroft_karp(left: Iterable[Hashable], right: Iterable[Hashable],
+                  adjacency: Mapping[Hashable, Iterable[Hashable]]) -> Matching:
+    """
+    Maximum bipartite matching in O(E sqrt(V)). adjacency maps each left vertex to its
+    right neighbors; left vertices without an entry have none. Each phase finds a
+    maximal set of vertex-disjoint shortest augmenting paths: a BFS layers the left
+    vertices from the free ones, then an iterative DFS with per-vertex edge pointers
+    follows the layers. Also returns a minimum vertex cover read off the final BFS.
+    """
+    left = list(left)
+    right = list(right)
+    right_index = {v: j for j, v in enumerate(right)}
+    neighbors = [[right_index[v] for v in adjacency.get(u, ())] for u in left]
+    match_left = [-1] * len(left)
+    match_right = [-1] * len(right)
+
+    while True:
+        # Layer the left vertices by alternating path length from a free left vertex
+        layer = [-1] * len(left)
+        queue = deque()
+        for u in range(len(left)):
+            if match_left[u] == -1:
+                layer[u] = 0
+                queue.append(u)
+        free_layer = -1  # Layer of the shortest augmenting paths
+        while queue:
+            u = queue.popleft()
+            if free_layer != -1 and layer[u] >= free_layer:
+                break
+            for v in neighbors[u]:
+                w = match_right[v]
+                if w == -1:
+                    free_layer = layer[u]
+                elif layer[w] == -1:
+                    layer[w] = layer[u] + 1
+                    queue.append(w)
+        if free_layer == -1:
+            break
+
+        position = [0] * len(left)
+        for root in range(len(left)):
+            if match_left[root] != -1:
+                continue
+            stack = [root]
+            while stack:
+                u = stack[-1]
+                edges = neighbors[u]
+                if position[u] == len(edges):  # Dead end for this phase
+                    layer[u] = -1
+                    stack.pop()
+                    continue
+                v = edges[position[u]]
+                position[u] += 1
+                w = match_right[v]
+                if w == -1:
+                    if layer[u] != free_layer:
+                        continue
+                    for x in stack:  # Flip the path: every x takes the vertex it stepped through
+                        y = neighbors[x][position[x] - 1]
+                        match_left[x] = y
+                        match_right[y] = x
+                        layer[x] = -1  # Vertex-disjoint paths within a phase
+                    break
+                if layer[w] == layer[u] + 1:
+                    stack.append(w)
+
+    # König: Z = vertices reachable from free left vertices by alternating paths
+    left_seen = [False] * len(left)
+    right_seen = [False] * len(right)
+    queue = deque(u for u in range(len(left)) if match_left[u] == -1)
+    for u in queue:
+        left_seen[u] = True
+    while queue:
+        u = queue.popleft()
+        for v in neighbors[u]:
+            if not right_seen[v]:
+                right_seen[v] = True
+                w = match_right[v]
+                if w != -1 and not left_seen[w]:
+                    left_seen[w] = True
+                    queue.append(w)
+
+    pairs = {left[u]: right[v] for u, v in enumerate(match_left) if v != -1}
+    left_cover = {left[u] for u in range(len(left)) if not left_seen[u]}
+    right_cover = {right[v] for v in range(len(right)) if right_seen[v]}
+    return Matching(pairs, left_cover, right_cover)
+
+
+def matching_from_graph(graph: Graph, source: Node, sink: Node) -> Matching:
+    """
+    Runs hopcroft_karp on an assignment problem encoded for the flow solvers
+    (source -> left -> right -> sink), such as generators.bipartite_graph builds.
+    Left vertices are the source's neighbors, right vertices the sink's; capacities
+    are ignored, so the result equals the max flow only for unit capacities.
+    """
+    left = [edge.target for edge in source.edges if edge.capacity > 0]
+    right = [edge.target for edge in sink.edges if edge.reverse.capacity > 0]
+    right_set = set(right)
+    adjacency: Dict[Node, List[Node]] = {
+        u: [edge.target for edge in u.edges if edge.capacity > 0 and edge.target in right_set] for u in left}
+    return hopcroft_karp(left, right, adjacency)
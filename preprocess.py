@@ -0,0 +1,286 @@
+"""
+Reduction pass that shrinks a max-flow instance before solving it.
+
+    reduction = reduce_graph(graph, source, sink)
+    max_flow = reduction.solve()        # flows land on the original Edge objects
+    cut = graph.min_cut(source, sink)
+
+The reduction keeps the maximum flow value and lets the flow be mapped back:
+
+- parallel edges (and edges in opposite directions) between two nodes become one
+  edge pair whose capacities are the sums,
+- nodes that cannot be reached from the source or cannot reach the sink are dropped,
+  as are non-terminal nodes with a single neighbor (dead ends),
+- a non-terminal node with exactly two neighbors u and v is contracted into a u-v edge
+  pair with capacity min(c(u, w), c(w, v)) one way and min(c(v, w), c(w, u)) the other.
+
+Every edge pair of the reduced graph keeps a link to the original edges it stands for,
+so a reduced flow is pushed back through parallel groups and series chains exactly.
+"""
+from __future__ import annotations
+from collections import deque
+import math
+from typing import Dict, List, Set, Tuple
+
+try:
+    from .graph import Edge, Graph, Node, SOLVERS
+except ImportError:  # imported as a top-level script module
+    from graph import Edge, Graph, Node, SOLVERS
+
+
+def _close(a: float, b: float) -> bool:
+    """
+    Equal up to the rounding of splitting and re-adding float amounts.
+    """
+    return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-12)
+
+
+class _EdgeLink:
+    """
+    One original edge pair between tail and head.
+    """
+    __slots__ = ("tail", "head", "edge")
+
+    def __init__(self, tail: int, head: int, edge: Edge) -> None:
+        self.tail = tail
+        self.head = head
+        self.edge = edge
+
+    @property
+    def ends(self) -> Tuple[int, int]:
+        return self.tail, self.head
+
+    def capacity(self, u: int) -> float:
+        return self.edge.capacity if u == self.tail else self.edge.reverse.capacity
+
+    def push(self, u: int, amount: float) -> None:
+        edge = self.edge if u == self.tail else self.edge.reverse
+        edge.flow += amount
+        if _close(edge.flow, edge.capacity):  # Saturated, without a rounding residual left over
+            edge.flow = edge.capacity
+        edge.reverse.flow = -edge.flow
+
+
+class _ParallelLink:
+    """
+    Links joining the same two nodes, used side by side.
+    """
+    def __init__(self, links: List) -> None:
+        self.ends = links[0].ends
+        self.links = links
+
+    def capacity(self, u: int) -> float:
+        return sum(link.capacity(u) for link in self.links)
+
+    def push(self, u: int, amount: float) -> None:
+        if amount < 0:
+            u = self.ends[1] if u == self.ends[0] else self.ends[0]
+            amount = -amount
+        for link in self.links:
+            if amount <= 0 or _close(amount, 0):
+                break
+            capacity = link.capacity(u)
+            share = capacity if amount > capacity or _close(amount, capacity) else amount
+            if share > 0:
+                link.push(u, share)
+                amount -= share
+
+
+class _SeriesLink:
+    """
+    A chain of links through contracted nodes, path[0] -> path[1] -> ... -> path[-1].
+    """
+    def __init__(self, path: List[int], links: List) -> None:
+        self.ends = (path[0], path[-1])
+        self.path = path
+        self.links = links
+
+    def capacity(self, u: int) -> float:
+        if u == self.ends[0]:
+            return min(link.capacity(w) for link, w in zip(self.links, self.path))
+        return min(link.capacity(w) for link, w in zip(self.links, self.path[1:]))
+
+    def push(self, u: int, amount: float) -> None:
+        entries = self.path if u == self.ends[0] else self.path[1:]
+        for link, w in zip(self.links, entries):
+            link.push(w, amount)
+
+
+def _oriented(link, start: int) -> Tuple[List[int], List]:
+    """
+    Path and links of link read from start, flattening series chains.
+    """
+    if isinstance(link, _SeriesLink):
+        if start == link.ends[0]:
+            return list(link.path), list(link.links)
+        return link.path[::-1], link.links[::-1]
+    end = link.ends[1] if start == link.ends[0] else link.ends[0]
+    return [start, end], [link]
+
+
+class Reduction:
+    """
+    A reduced copy of a graph. graph holds new Node objects (named like the originals)
+    for the nodes that survived; node_map maps original nodes to them.
+    """
+    def __init__(self, original: Graph, graph: Graph, source: Node, sink: Node,
+                 node_map: Dict[Node, Node], links: List[Tuple[int, Edge, object]]) -> None:
+        self.original = original
+        self.graph = graph
+        self.source = source
+        self.sink = sink
+        self.node_map = node_map
+        self._links = links  # (tail index, reduced edge, link) for every reduced edge pair
+
+    def __repr__(self):
+        before = sum(len(node.edges) for node in self.original.nodes.values()) // 2
+        after = len(self._links)
+        return f"Reduction({len(self.original.nodes)} -> {len(self.graph.nodes)} nodes, {before} -> {after} edges)"
+
+    def solve(self, solver: str = "dinic") -> float:
+        """
+        Solves the reduced graph from zero flow and maps the flow onto the original edges.
+        """
+        if solver not in SOLVERS:
+            raise ValueError(f"Unknown solver {solver!r}, expected one of {SOLVERS}")
+        self.graph.reset_calculated_flows()
+        max_flow = getattr(self.graph, solver)(self.source, self.sink)
+        self.apply_flows()
+        return max_flow
+
+    def apply_flows(self) -> None:
+        """
+        Replaces the flows of the original graph with the flow on the reduced graph.
+        Edges of dropped nodes get zero flow.
+        """
+        self.original.reset_calculated_flows()
+        for tail, edge, link in self._links:
+            link.push(tail, edge.flow)
+
+
+def reduce_graph(graph: Graph, source: Node, sink: Node) -> Reduction:
+    """
+    Reduces the graph for max-flow queries between source and sink. The graph itself
+    is not modified. Runs in O(V + E). Merged and contracted edges have no single
+    cost, so graphs with edge costs are rejected.
+    """
+    nodes = list(graph.nodes.values())
+    index = {node: i for i, node in enumerate(nodes)}
+    s, t = index[source], index[sink]
+    terminals = {s, t}
+
+    # Merge parallel edge pairs; adjacency[u][v] is the single link between u and v
+    adjacency: List[Dict[int, object]] = [{} for _ in nodes]
+    for tail, edge in graph.edge_pairs():
+        if edge.cost:
+            raise ValueError("reduce_graph does not preserve edge costs.")
+        u, v = index[tail], index[edge.target]
+        if u == v or (edge.capacity <= 0 and edge.reverse.capacity <= 0):
+            continue  # Self-loops and zero-capacity pairs never carry flow
+        add_link(adjacency, _EdgeLink(u, v, edge))
+
+    # Drop nodes off every source-sink path
+    alive = _reachable(adjacency, s, forward=True) & _reachable(adjacency, t, forward=False)
+    alive |= terminals
+    for u in range(len(nodes)):
+        if u not in alive:
+            for v in adjacency[u]:
+                if v in alive:
+                    del adjacency[v][u]
+            adjacency[u] = {}
+
+    # Remove dead ends and contract chains of two-neighbor nodes until neither applies
+    queue = deque(u for u in range(len(nodes)) if u in alive and u not in terminals)
+    while queue:
+        w = queue.popleft()
+        if w not in alive or w in terminals or len(adjacency[w]) > 2:
+            continue
+
+        if len(adjacency[w]) < 2:
+            for v in adjacency[w]:
+                del adjacency[v][w]
+                queue.append(v)
+            adjacency[w] = {}
+            alive.discard(w)
+            continue
+
+        first, second = adjacency[w]
+        path = _walk(adjacency, terminals, w, first)[::-1] + _walk(adjacency, terminals, w, second)[1:]
+        chain_path, chain_links = [], []
+        for p, q in zip(path, path[1:]):
+            sub_path, sub_links = _oriented(adjacency[p][q], p)
+            chain_path.extend(sub_path[:-1])
+            chain_links.extend(sub_links)
+        chain_path.append(path[-1])
+
+        u, v = path[0], path[-1]
+        del adjacency[u][path[1]]
+        del adjacency[v][path[-2]]
+        for x in path[1:-1]:
+            adjacency[x] = {}
+            alive.discard(x)
+        link = _SeriesLink(chain_path, chain_links)
+        if u != v and (link.capacity(u) > 0 or link.capacity(v) > 0):  # A chain from u back to u is a dead loop
+            add_link(adjacency, link)
+        queue.extend((u, v))
+
+    # Build the reduced graph in the original node order
+    kept = [u for u in range(len(nodes)) if u in alive]
+    reduced_nodes = {u: Node(nodes[u].name) for u in kept}
+    links = []
+    for u in kept:
+        for v, link in adjacency[u].items():
+            if u < v:
+                forward = Edge(reduced_nodes[v], link.capacity(u))
+                backward = Edge(reduced_nodes[u], link.capacity(v))
+                forward.reverse, backward.reverse = backward, forward
+                reduced_nodes[u].edges.append(forward)
+                reduced_nodes[v].edges.append(backward)
+                links.append((u, forward, link))
+
+    reduced = Graph({node.name: node for node in reduced_nodes.values()}, graph.directed)
+    node_map = {nodes[u]: node for u, node in reduced_nodes.items()}
+    return Reduction(graph, reduced, reduced_nodes[s], reduced_nodes[t], node_map, links)
+
+
+def _walk(adjacency: List[Dict[int, object]], terminals: Set[int], w: int, first: int) -> List[int]:
+    """
+    Nodes from w through its neighbor first and on through two-neighbor non-terminal
+    nodes, ending with the first node that is not one.
+    """
+    path = [w]
+    previous, current = w, first
+    while current not in terminals and current != w and len(adjacency[current]) == 2:
+        a, b = adjacency[current]
+        previous, current = current, b if a == previous else a
+        path.append(previous)
+    path.append(current)
+    return path
+
+
+def add_link(adjacency: List[Dict[int, object]], link) -> None:
+    """
+    Adds link between its two ends, merging it with an existing link there.
+    """
+    u, v = link.ends
+    existing = adjacency[u].get(v)
+    if existing is not None:
+        links = existing.links if isinstance(existing, _ParallelLink) else [existing]
+        link = _ParallelLink(links + [link])
+    adjacency[u][v] = adjacency[v][u] = link
+
+
+def _reachable(adjacency: List[Dict[int, object]], start: int, forward: bool) -> Set[int]:
+    """
+    Nodes reachable from start along positive capacities, or (forward=False) the
+    nodes from which start is reachable.
+    """
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        u = queue.popleft()
+        for v, link in adjacency[u].items():
+            if v not in seen and (link.capacity(u) if forward else link.capacity(v)) > 0:
+                seen.add(v)
+                queue.append(v)
+    return seen
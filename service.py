@@ -0,0 +1,250 @@
+"""
+asyncio front end for max-flow and min-cut queries against registered graphs.
+
+    service = FlowService()
+    service.register("network", graph)
+    flow = await service.max_flow("network", "S", "T")
+    cut = await service.min_cut("network", "S", "T")
+
+Queries never block the event loop. Those arriving within batch_window seconds are
+collected and sent to the executor as one job per graph, and a query identical to
+one already in flight (same graph contents and terminals) waits on that one instead
+of being solved again. Every job solves in fresh workspaces over the graph's shared
+Graph.snapshot(), so the registered Graph and its Edge.flow values are never touched.
+"""
+from __future__ import annotations
+import asyncio
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+import math
+import statistics
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+try:
+    from .graph import Graph, Node, MinCut
+    from .csr import CSRGraph
+except ImportError:  # imported as a top-level script module
+    from graph import Graph, Node, MinCut
+    from csr import CSRGraph
+
+MAX_FLOW = "max_flow"
+MIN_CUT = "min_cut"
+
+# (source index, sink index, kind)
+Query = Tuple[int, int, str]
+
+
+def _solve_group(csr: CSRGraph, queries: List[Query]) -> List[Tuple[float, Optional[List[int]]]]:
+    """
+    Executor side: solves every query of a batch on its own workspace. Min-cut queries
+    also return the source side, read off the level graph of dinic's final BFS.
+    """
+    results = []
+    for source, sink, kind in queries:
+        workspace = csr.workspace()
+        max_flow = workspace.dinic(source, sink)
+        side = [u for u, level in enumerate(workspace.level) if level >= 0] if kind == MIN_CUT else None
+        results.append((max_flow, side))
+    return results
+
+
+class ServiceStats:
+    """
+    Counters of a FlowService. Latencies cover the most recent `window` queries, from
+    submission to result.
+    """
+    def __init__(self, window: int = 1000) -> None:
+        self.submitted = 0
+        self.coalesced = 0  # Queries answered by an identical query already in flight
+        self.completed = 0
+        self.failed = 0
+        self.batches = 0
+        self.waiting = 0  # Collected, not yet handed to the executor
+        self.running = 0  # In the executor
+        self.latencies: deque = deque(maxlen=window)
+
+    @property
+    def queue_depth(self) -> int:
+        return self.waiting + self.running
+
+    def __repr__(self): return f"ServiceStats({self.completed} completed, queue depth {self.queue_depth})"
+
+    def as_dict(self) -> Dict:
+        latencies = sorted(self.latencies)
+        return {
+            "submitted": self.submitted,
+            "coalesced": self.coalesced,
+            "completed": self.completed,
+            "failed": self.failed,
+            "batches": self.batches,
+            "queue_depth": self.queue_depth,
+            "latency_median": statistics.median(latencies) if latencies else None,
+            "latency_p95": latencies[max(0, math.ceil(0.95 * len(latencies)) - 1)] if latencies else None,
+            "latency_max": latencies[-1] if latencies else None,
+        }
+
+
+class FlowService:
+    """
+    Serves queries on the running event loop. The default executor is a thread pool,
+    which keeps the loop responsive; pass a ProcessPoolExecutor to solve on several
+    cores (graph arrays are then pickled once per batch).
+    """
+    def __init__(self, executor: Optional[Executor] = None, batch_window: float = 0.001,
+                 max_batch: int = 64) -> None:
+        self._own_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="flow-service")
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.stats = ServiceStats()
+        self._graphs: Dict[str, Graph] = {}
+        self._pending: List[Tuple[CSRGraph, Query, tuple]] = []
+        self._in_flight: Dict[tuple, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._tasks: Set[asyncio.Task] = set()  # Running batches, referenced until done
+
+    def __repr__(self): return f"FlowService({len(self._graphs)} graphs, {self.stats!r})"
+
+    def register(self, name: str, graph: Graph) -> None:
+        """
+        Makes a graph queryable under name. Later add_edge / update_capacities calls on it
+        are picked up by the next query. Computes the graph's fingerprint, O(E) once.
+        """
+        graph.fingerprint
+        self._graphs[name] = graph
+
+    def unregister(self, name: str) -> None:
+        del self._graphs[name]
+
+    async def max_flow(self, name: str, source: Union[str, Node], sink: Union[str, Node]) -> float:
+        max_flow, _ = await self._submit(name, source, sink, MAX_FLOW)
+        return max_flow
+
+    async def min_cut(self, name: str, source: Union[str, Node], sink: Union[str, Node]) -> MinCut:
+        """
+        Minimum cut in terms of the registered graph's Node and Edge objects.
+        """
+        graph = self._graphs[name]
+        _, side = await self._submit(name, source, sink, MIN_CUT)
+        nodes = list(graph.nodes.values())
+        source_side = {nodes[u] for u in side}
+        edges = [edge for node in source_side for edge in node.edges
+                 if edge.target not in source_side and edge.capacity > 0]
+        return MinCut(source_side, edges, sum(edge.capacity for edge in edges))
+
+    async def _submit(self, name: str, source: Union[str, Node], sink: Union[str, Node],
+                      kind: str) -> Tuple[float, Optional[List[int]]]:
+        graph = self._graphs[name]
+        fingerprint = graph.fingerprint
+        if graph._arrays is not None and graph._arrays[0] == fingerprint:
+            csr = graph.snapshot()
+        else:  # Building the arrays is O(E), keep it off the loop
+            csr = await asyncio.to_thread(graph.snapshot)
+        query = (csr.node_index(source), csr.node_index(sink), kind)
+        key = (name, fingerprint) + query
+        self.stats.submitted += 1
+        start = time.perf_counter()
+
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.stats.coalesced += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._in_flight[key] = future
+            self._pending.append((csr, query, key))
+            self.stats.waiting += 1
+            if self._flush_handle is None:
+                self._flush_handle = asyncio.get_running_loop().call_later(self.batch_window, self._flush)
+
+        try:
+            result = await asyncio.shield(future)
+        except Exception:
+            self.stats.failed += 1
+            raise
+        self.stats.completed += 1
+        self.stats.latencies.append(time.perf_counter() - start)
+        return result
+
+    def _flush(self) -> None:
+        """
+        Hands the collected queries to the executor, one job per graph snapshot and
+        at most max_batch queries per job.
+        """
+        self._flush_handle = None
+        groups: Dict[int, Tuple[CSRGraph, List[Tuple[Query, tuple]]]] = {}
+        for csr, query, key in self._pending:
+            groups.setdefault(id(csr), (csr, []))[1].append((query, key))
+        self._pending = []
+
+        for csr, batch in groups.values():
+            for i in range(0, len(batch), self.max_batch):
+                task = asyncio.ensure_future(self._run(csr, batch[i:i + self.max_batch]))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, csr: CSRGraph, batch: List[Tuple[Query, tuple]]) -> None:
+        self.stats.batches += 1
+        self.stats.waiting -= len(batch)
+        self.stats.running += len(batch)
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(self.executor, _solve_group, csr, [query for query, _ in batch])
+        except Exception as error:
+            for _, key in batch:
+                self._in_flight.pop(key).set_exception(error)
+        else:
+            for (_, key), result in zip(batch, results):
+                self._in_flight.pop(key).set_result(result)
+        finally:
+            self.stats.running -= len(batch)
+
+    def close(self) -> None:
+        if self._own_executor:
+            self.executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> FlowService:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+
+class LocalClient:
+    """
+    Blocking client for a FlowService running on its own event loop thread in this
+    process, for scripts and tests that are not async themselves.
+    """
+    def __init__(self, service: Optional[FlowService] = None) -> None:
+        self.service = service or FlowService()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="flow-service-loop", daemon=True)
+        self._thread.start()
+
+    def _call(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def register(self, name: str, graph: Graph) -> None:
+        self.service.register(name, graph)
+
+    def max_flow(self, name: str, source: Union[str, Node], sink: Union[str, Node]) -> float:
+        return self._call(self.service.max_flow(name, source, sink))
+
+    def min_cut(self, name: str, source: Union[str, Node], sink: Union[str, Node]) -> MinCut:
+        return self._call(self.service.min_cut(name, source, sink))
+
+    def stats(self) -> Dict:
+        return self.service.stats.as_dict()
+
+    def close(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self.service.close()
+
+    def __enter__(self) -> LocalClient:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,113 @@
+"""
+Compact binary snapshots of a graph's topology, capacities and (optionally) flows.
+
+A snapshot is the CSRGraph arrays written back to back after a fixed header:
+
+    header    magic, byte order, num_nodes, num_arcs, flags, names size
+    offsets   int64  x (num_nodes + 1)
+    heads     int64  x num_arcs
+    reverse   int64  x num_arcs
+    capacity  float64 x num_arcs
+    flow      float64 x num_arcs   (only with FLOWS)
+    cost      float64 x num_arcs   (only with COSTS)
+    names     UTF-8, NUL-separated  (only with NAMES)
+
+load_snapshot maps the file read-only and casts memoryviews over the sections, so
+opening a snapshot copies nothing but the names (and saved flows); processes loading
+the same file share its pages through the OS page cache.
+"""
+from __future__ import annotations
+import mmap
+import struct
+import sys
+from array import array
+from typing import Union
+
+try:
+    from .graph import Graph
+    from .csr import CSRGraph
+except ImportError:  # imported as a top-level script module
+    from graph import Graph
+    from csr import CSRGraph
+
+MAGIC = b"MAXFLOW1"
+HEADER = struct.Struct("<8s8sqqqq")  # magic, byte order, num_nodes, num_arcs, flags, names size
+
+FLOWS = 1
+NAMES = 2
+DIRECTED = 4
+COSTS = 8
+
+
+def save_snapshot(graph: Union[Graph, CSRGraph], path: str, flows: bool = False) -> None:
+    """
+    Writes a snapshot of a Graph or CSRGraph. Graphs keep their node order, edge order,
+    edge costs and directed flag; flows=True also stores the current flow on every arc.
+    """
+    if isinstance(graph, Graph):
+        graph = CSRGraph.from_graph(graph)
+    flags = (FLOWS if flows else 0) | (DIRECTED if graph.directed else 0) | (COSTS if graph.cost is not None else 0)
+    names = b""
+    if graph.names is not None:
+        flags |= NAMES
+        names = "\0".join(graph.names).encode()
+
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, sys.byteorder.encode().ljust(8), graph.num_nodes, graph.num_arcs,
+                               flags, len(names)))
+        sections = [(graph.offsets, 'q'), (graph.heads, 'q'), (graph.reverse, 'q'), (graph.capacity, 'd')]
+        if flows:
+            sections.append((graph.flow, 'd'))
+        if graph.cost is not None:
+            sections.append((graph.cost, 'd'))
+        for values, typecode in sections:
+            file.write(values if isinstance(values, (array, memoryview)) else array(typecode, values))
+        file.write(names)
+
+
+def load_snapshot(path: str) -> CSRGraph:
+    """
+    Maps a snapshot into a CSRGraph without copying its topology or capacities.
+    The arrays are read-only views; flows live in a private, writable mapping.
+    """
+    with open(path, "rb") as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, byteorder, num_nodes, num_arcs, flags, names_size = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a graph snapshot")
+    if byteorder.rstrip() != sys.byteorder.encode():
+        raise ValueError(f"{path} was written on a {byteorder.decode().strip()}-endian machine")
+
+    view = memoryview(buffer)
+    position = HEADER.size
+
+    def section(typecode: str, count: int) -> memoryview:
+        nonlocal position
+        start = position
+        position += 8 * count
+        return view[start:position].cast(typecode)
+
+    offsets = section('q', num_nodes + 1)
+    heads = section('q', num_arcs)
+    reverse = section('q', num_arcs)
+    capacity = section('d', num_arcs)
+    # Flows are per-process state: an anonymous mapping is zero-filled lazily by the OS
+    flow = memoryview(mmap.mmap(-1, max(8 * num_arcs, 1)))[:8 * num_arcs].cast('d')
+    if flags & FLOWS:
+        flow[:] = section('d', num_arcs)
+    cost = section('d', num_arcs) if flags & COSTS else None
+    names = None
+    if flags & NAMES:
+        names = bytes(view[position:position + names_size]).decode().split("\0") if num_nodes else []
+
+    graph = CSRGraph(offsets, heads, capacity, reverse, names, flow, cost)
+    graph.directed = bool(flags & DIRECTED)
+    return graph
+
+
+def load_graph(path: str) -> Graph:
+    """
+    Rebuilds the Node/Edge graph of a snapshot, including flows if they were saved.
+    """
+    return load_snapshot(path).to_graph()
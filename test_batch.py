@@ -0,0 +1,51 @@
+from .graph import Graph, SOLVERS
+from .batch import solve_batch
+from .csr import CSRGraph
+from .benchmark import run_benchmarks, corpus
+import pytest
+
+
+def test_solve_batch_matches_direct_solves():
+    graphs = [Graph.generate_random_graph(size, size * 3, 10, seed=size) for size in [30, 80, 150]]
+    jobs = []
+    for graph in graphs:
+        nodes = list(graph.nodes.values())
+        for i in range(1, 6):
+            jobs.append((graph, nodes[0], nodes[-i], "dinic"))
+            jobs.append((graph, nodes[i], nodes[-1], "push_relabel"))
+
+    expected = []
+    for graph, source, sink, _ in jobs:
+        graph.reset_calculated_flows()
+        expected.append(graph.edmonds_karp(source, sink))
+
+    for processes in [1, 2]:
+        results = solve_batch(jobs, processes=processes)
+        assert [result.max_flow for result in results] == expected
+        assert all(result.seconds >= 0 for result in results)
+
+
+def test_array_solvers_skip_graph_rebuild(monkeypatch):
+    graph = Graph.generate_random_graph(40, 120, 10, seed=9)
+    nodes = list(graph.nodes.values())
+    expected = graph.dinic(nodes[0], nodes[-1])
+
+    def to_graph(self, directed=None):
+        raise AssertionError("dinic and edmonds_karp should run on the arrays")
+    monkeypatch.setattr(CSRGraph, "to_graph", to_graph)
+    jobs = [(graph, nodes[0], nodes[-1], solver) for solver in ("dinic", "edmonds_karp")]
+    assert [result.max_flow for result in solve_batch(jobs, processes=1)] == [expected, expected]
+
+
+def test_solve_batch_rejects_unknown_solver():
+    graph = Graph.generate_random_graph(5, 6, seed=1)
+    nodes = list(graph.nodes.values())
+    with pytest.raises(ValueError):
+        solve_batch([(graph, nodes[0], nodes[1], "simplex")], processes=1)
+
+
+def test_parallel_benchmarks():
+    cases = corpus(["random", "grid"], [50], [0, 1])
+    results = run_benchmarks(cases, warmup=0, repeat=1, processes=2)
+    assert [result["case"] for result in results["results"][::len(SOLVERS)]] == \
+           ["random-50-s0", "random-50-s1", "grid-50-s0", "grid-50-s1"]
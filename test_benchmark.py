@@ -0,0 +1,27 @@
+from .graph import SOLVERS
+from .benchmark import run_benchmarks, compare, corpus, percentile, measure_startup, FAMILIES
+import json
+
+
+def test_run_benchmarks_is_json_serializable():
+    results = run_benchmarks(corpus(list(FAMILIES), [60], [0]), warmup=0, repeat=2)
+    assert len(results["results"]) == len(FAMILIES) * len(SOLVERS)
+    for result in results["results"]:
+        assert result["p95"] >= result["median"] >= result["min"] > 0
+    assert json.loads(json.dumps(results)) == results
+
+
+def test_compare_flags_regressions():
+    baseline = {"results": [{"case": "c", "solver": "dinic", "median": 0.010},
+                            {"case": "c", "solver": "push_relabel", "median": 0.010}]}
+    current = {"results": [{"case": "c", "solver": "dinic", "median": 0.020},
+                           {"case": "c", "solver": "push_relabel", "median": 0.011},
+                           {"case": "new", "solver": "dinic", "median": 1.0}]}
+    regressions = compare(current, baseline, tolerance=0.25)
+    assert [(r["case"], r["solver"]) for r in regressions] == [("c", "dinic")]
+    assert percentile([5, 1, 3, 2, 4], 0.95) == 5
+
+
+def test_graph_import_skips_plotting_libraries():
+    startup = measure_startup(repeat=1)
+    assert startup["heavy_modules"] == []
@@ -0,0 +1,77 @@
+from .graph import Node, Graph
+from .cache import FlowCache
+import pytest
+import random
+
+
+def build_graph():
+    nodes = {name: Node(name) for name in ["S", "A", "B", "T"]}
+    graph = Graph(nodes, directed=True)
+    graph.add_edge(nodes["S"], nodes["A"], 4)
+    graph.add_edge(nodes["S"], nodes["B"], 3)
+    graph.add_edge(nodes["A"], nodes["B"], 2)
+    graph.add_edge(nodes["A"], nodes["T"], 1)
+    graph.add_edge(nodes["B"], nodes["T"], 6)
+    return graph, nodes
+
+
+def test_fingerprint_tracks_changes():
+    graph, nodes = build_graph()
+    original = graph.fingerprint
+    assert build_graph()[0].fingerprint == original  # Content based, not identity based
+
+    edge = nodes["A"].edges[-1]  # A -> T
+    graph.update_capacity(edge, 5, nodes["S"], nodes["T"])
+    changed = graph.fingerprint
+    assert changed != original
+    graph.update_capacity(edge, 1, nodes["S"], nodes["T"])
+    assert graph.fingerprint == original
+
+    nodes["B"].add_edge(nodes["T"], 2, directed=True)  # Node.add_edge is tracked too
+    assert graph.fingerprint not in (original, changed)
+
+
+def test_fingerprint_matches_recomputation():
+    random.seed(11)
+    graph = Graph.generate_random_graph(40, 120, 10)
+    graph.fingerprint
+    nodes = list(graph.nodes.values())
+    for _ in range(20):
+        graph.add_edge(random.choice(nodes), random.choice(nodes), random.randint(1, 10))
+        node = random.choice(nodes)
+        graph.update_capacity(random.choice(node.edges), random.randint(0, 10), nodes[0], nodes[-1])
+
+    incremental = graph.fingerprint
+    graph._fingerprint = None
+    assert graph.fingerprint == incremental
+
+
+def test_cache_hits_and_invalidation():
+    graph, nodes = build_graph()
+    cache = FlowCache()
+    assert cache.max_flow(graph, nodes["S"], nodes["T"]) == 6
+    assert cache.max_flow(graph, nodes["S"], nodes["T"], "edmonds_karp") == 6
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    graph.add_edge(nodes["S"], nodes["T"], 10)
+    assert cache.max_flow(graph, nodes["S"], nodes["T"]) == 16
+    assert graph.flow_value(nodes["S"]) == 16  # Misses leave the solved flow on the edges
+    assert cache.misses == 2
+
+    with pytest.raises(ValueError):
+        cache.max_flow(graph, nodes["S"], nodes["T"], "bogus")
+
+
+def test_cache_evicts_least_recently_used():
+    graph, nodes = build_graph()
+    cache = FlowCache(maxsize=2)
+    cache.max_flow(graph, nodes["S"], nodes["T"])
+    cache.max_flow(graph, nodes["S"], nodes["B"])
+    cache.max_flow(graph, nodes["S"], nodes["T"])  # Refreshes S-T
+    cache.max_flow(graph, nodes["A"], nodes["T"])  # Evicts S-B
+    assert len(cache) == 2
+
+    cache.max_flow(graph, nodes["S"], nodes["T"])
+    assert cache.hits == 2
+    cache.max_flow(graph, nodes["S"], nodes["B"])
+    assert cache.misses == 4
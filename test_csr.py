@@ -0,0 +1,167 @@
+from .graph import Node, Graph
+from .csr import CSRGraph
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import random
+
+
+def build_complex_graph():
+    nodes = {name: Node(name) for name in ["S", "0", "1", "2", "3", "4", "T"]}
+    nodes["S"].add_edge(nodes["0"], 5)
+    nodes["S"].add_edge(nodes["1"], 10)
+    nodes["S"].add_edge(nodes["2"], 15)
+    nodes["0"].add_edge(nodes["3"], 10)
+    nodes["1"].add_edge(nodes["0"], 15)
+    nodes["1"].add_edge(nodes["4"], 20)
+    nodes["3"].add_edge(nodes["4"], 25)
+    nodes["4"].add_edge(nodes["2"], 5)
+    nodes["3"].add_edge(nodes["T"], 10)
+    nodes["4"].add_edge(nodes["T"], 15)
+    return Graph(nodes), nodes
+
+
+def test_from_graph_matches_node_solvers():
+    graph, nodes = build_complex_graph()
+    csr = CSRGraph.from_graph(graph)
+    expected = graph.dinic(nodes["S"], nodes["T"])
+
+    assert csr.edmonds_karp(nodes["S"], nodes["T"]) == expected
+    csr.reset_calculated_flows()
+    assert csr.dinic(nodes["S"], nodes["T"]) == expected
+
+
+def test_from_edges_matches_add_edge():
+    edges = [(0, 1, 10), (0, 2, 5), (1, 3, 10), (2, 3, 10), (1, 2, 3)]
+    nodes = [Node(str(i)) for i in range(4)]
+    for u, v, capacity in edges:
+        nodes[u].add_edge(nodes[v], capacity)
+
+    csr = CSRGraph.from_edges(4, edges)
+    expected = CSRGraph.from_graph(Graph({node.name: node for node in nodes}))
+    assert list(csr.offsets) == list(expected.offsets)
+    assert list(csr.heads) == list(expected.heads)
+    assert list(csr.reverse) == list(expected.reverse)
+    assert csr.dinic(0, 3) == 15
+
+
+def test_random_graphs_and_apply_flows():
+    random.seed(7)
+    for size in [10, 50, 200]:
+        graph = Graph.generate_random_graph(size, size * 3, 10)
+        source = next(iter(graph.nodes.values()))
+        sink = next(reversed(graph.nodes.values()))
+        expected = graph.edmonds_karp(source, sink)
+        graph.reset_calculated_flows()
+
+        csr = CSRGraph.from_graph(graph)
+        assert csr.dinic(source, sink) == expected
+        csr.apply_flows(graph)
+        assert sum(edge.flow for edge in source.edges) == expected
+        csr.reset_calculated_flows()
+        assert csr.edmonds_karp(source, sink) == expected
+
+
+def test_apply_flows_drops_cached_levels():
+    graph = Graph.generate_random_graph(30, 90, 10, seed=5)
+    nodes = list(graph.nodes.values())
+    csr = CSRGraph.from_graph(graph)  # Zero flow
+    graph.dinic(nodes[0], nodes[-1])
+    graph.min_cut(nodes[0], nodes[-1])
+
+    csr.apply_flows(graph)
+    with pytest.raises(ValueError):
+        graph.min_cut(nodes[0], nodes[-1])
+
+
+def test_directed_from_edges():
+    edges = [(0, 1, 10), (2, 1, 10), (0, 2, 2), (1, 3, 3), (2, 3, 10)]
+    assert CSRGraph.from_edges(4, edges).dinic(0, 3) == 12
+    assert CSRGraph.from_edges(4, edges, directed=True).dinic(0, 3) == 5
+
+
+def test_to_graph_round_trip():
+    graph, nodes = build_complex_graph()
+    graph.push_relabel(nodes["S"], nodes["T"])
+    copy = CSRGraph.from_graph(graph).to_graph()
+
+    assert list(copy.nodes) == list(graph.nodes)
+    for name, node in graph.nodes.items():
+        twin = copy.nodes[name]
+        assert [(e.target.name, e.capacity, e.flow) for e in twin.edges] == \
+               [(e.target.name, e.capacity, e.flow) for e in node.edges]
+        assert all(e.reverse.reverse is e and e.reverse.target is twin for e in twin.edges)
+
+    copy.reset_calculated_flows()
+    assert copy.dinic(copy.nodes["S"], copy.nodes["T"]) == graph.flow_value(nodes["S"])
+
+
+def test_workspaces_share_topology():
+    graph, nodes = build_complex_graph()
+    csr = CSRGraph.from_graph(graph)
+    expected = graph.dinic(nodes["S"], nodes["T"])
+    first, second = csr.workspace(), csr.workspace()
+    assert first.heads is csr.heads and first.flow is not second.flow
+
+    assert first.dinic("S", "T") == expected
+    assert not any(second.flow)
+    assert second.edmonds_karp(nodes["S"], nodes["T"]) == expected
+    first.reset_calculated_flows()
+    assert first.dinic("S", "T") == expected
+
+
+def test_concurrent_queries():
+    random.seed(9)
+    graph = Graph.generate_random_graph(300, 900, 10)
+    nodes = list(graph.nodes.values())
+    pairs = [(nodes[0], nodes[i]) for i in range(1, 300, 15)]
+    expected = []
+    for source, sink in pairs:
+        graph.reset_calculated_flows()
+        expected.append(graph.dinic(source, sink))
+    graph.reset_calculated_flows()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda pair: graph.query(*pair), pairs))
+    assert results == expected
+    assert all(edge.flow == 0 for node in nodes for edge in node.edges)
+
+    before = graph.query(nodes[0], nodes[-1])
+    graph.add_edge(nodes[0], nodes[-1], 100)  # Rebuilds the shared snapshot
+    assert graph.query(nodes[0], nodes[-1], "edmonds_karp") == before + 100
+
+
+def test_decompose_flow():
+    random.seed(27)
+    for directed in (False, True):
+        for size in [10, 50, 200]:
+            graph = Graph.generate_random_graph(size, size * 3, 10, directed=directed)
+            nodes = list(graph.nodes.values())
+            source, sink = nodes[0], nodes[-1]
+            expected = graph.dinic(source, sink)
+
+            paths = list(graph.decompose_flow(source, sink))
+            assert sum(amount for amount, _ in paths) == expected
+            used = {}
+            for amount, path in paths:
+                assert amount > 0 and path[0] is source and path[-1] is sink
+                assert len(set(path)) == len(path)
+                for u, v in zip(path, path[1:]):
+                    edge = next(edge for edge in u.edges if edge.target is v and edge.flow > 0)
+                    used[u, v] = used.get((u, v), 0) + amount
+            assert all(amount <= sum(e.flow for e in u.edges if e.target is v and e.flow > 0)
+                       for (u, v), amount in used.items())
+
+
+def test_decompose_flow_reports_cycles():
+    edges = [(0, 1, 5), (1, 2, 5), (2, 3, 5), (2, 1, 2), (4, 5, 1), (5, 4, 1)]
+    csr = CSRGraph.from_edges(6, edges, directed=True)
+    # 3 units along 0-1-2-3, plus a 1-2-1 cycle of 2 and a 4-5-4 circulation of 1
+    for a, amount in zip(csr.pair_arcs, [3, 5, 3, 2, 1, 1]):
+        csr.flow[a] = amount
+        csr.flow[csr.reverse[a]] = -amount
+
+    decomposition = csr.decompose_flow(0, 3)
+    assert next(decomposition) == (3, [0, 1, 2, 3])
+    assert list(decomposition) == []
+    assert list(csr.decompose_flow(0, 3, cycles=True)) == [(3, [0, 1, 2, 3]), (2, [1, 2, 1]), (1, [4, 5, 4])]
+    assert csr.flow[csr.pair_arcs[1]] == 5  # Arrays untouched
@@ -1,7 +1,8 @@
-from .graph import Node, Graph
+from .graph import Node, Graph, SolverObserver, EdmondsKarpPrinter, generate_random_edges
 import pytest
+import random
 
-def assert_both(graph, nodes, expected, message):
+def assert_all(graph, nodes, expected, message):
     max_flow_ek = graph.edmonds_karp(nodes["S"], nodes["T"])
     assert max_flow_ek == expected, "Edmonds-Karp " + message
 
@@ -10,6 +11,15 @@ def assert_both(graph, nodes, expected, message):
     max_flow_d = graph.dinic(nodes["S"], nodes["T"])
     assert max_flow_d == expected, "Dinic " + message
 
+    graph.reset_calculated_flows()
+
+    max_flow_pr = graph.push_relabel(nodes["S"], nodes["T"])
+    assert max_flow_pr == expected, "Push-relabel " + message
+
+    for solver in ["edmonds_karp_scaling", "dinic_scaling"]:
+        graph.reset_calculated_flows()
+        assert getattr(graph, solver)(nodes["S"], nodes["T"]) == expected, solver + " " + message
+
 def test_simple_graph():
     # Simple graph with a single source-sink path
     nodes = {name: Node(name) for name in ["S", "A", "B", "T"]}
@@ -18,7 +28,7 @@ def test_simple_graph():
     nodes["B"].add_edge(nodes["T"], 10)
 
     graph = Graph(nodes)
-    assert_both(graph, nodes, 5, "Simple graph maximum flow should be 5")
+    assert_all(graph, nodes, 5, "Simple graph maximum flow should be 5")
 
 def test_disconnected_graph():
     # Graph where source and sink are not connected
@@ -27,7 +37,7 @@ def test_disconnected_graph():
     nodes["B"].add_edge(nodes["T"], 10)
 
     graph = Graph(nodes)
-    assert_both(graph, nodes, 0, "Disconnected graph maximum flow should be 0")
+    assert_all(graph, nodes, 0, "Disconnected graph maximum flow should be 0")
 
 def test_graph_with_cycles():
     # Graph with cycles
@@ -39,7 +49,7 @@ def test_graph_with_cycles():
     nodes["C"].add_edge(nodes["T"], 10)
 
     graph = Graph(nodes)
-    assert_both(graph, nodes, 10, "This Graph with cycles maximum flow should be 10")
+    assert_all(graph, nodes, 10, "This Graph with cycles maximum flow should be 10")
 
 def test_multiple_augmenting_paths():
     # Graph with multiple parallel paths
@@ -50,7 +60,7 @@ def test_multiple_augmenting_paths():
     nodes["B"].add_edge(nodes["T"], 10)
 
     graph = Graph(nodes)
-    assert_both(graph, nodes, 15, "Multiple augmenting paths maximum flow should be 15")
+    assert_all(graph, nodes, 15, "Multiple augmenting paths maximum flow should be 15")
 
 def test_zero_capacity_edges():
     # Graph with zero capacity edges
@@ -60,7 +70,7 @@ def test_zero_capacity_edges():
     nodes["B"].add_edge(nodes["T"], 10)
 
     graph = Graph(nodes)
-    assert_both(graph, nodes, 0, "Graph with zero capacity edges maximum flow should be 0")
+    assert_all(graph, nodes, 0, "Graph with zero capacity edges maximum flow should be 0")
 
 def test_uneven_capacities():
     # Graph with uneven capacities on the same path
@@ -70,7 +80,7 @@ def test_uneven_capacities():
     nodes["B"].add_edge(nodes["T"], 10000)
 
     graph = Graph(nodes)
-    assert_both(graph, nodes, 1, "Uneven capacities maximum flow should be 1")
+    assert_all(graph, nodes, 1, "Uneven capacities maximum flow should be 1")
 
 def test_complex_graph():
     # Create nodes for the graph
@@ -112,4 +122,412 @@ def test_complex_graph():
     # Compute and print the max flow using Dinic's algorithm
     # max_flow = graph.dinic(source, sink)
     # print(f"Maximum flow: {max_flow}")
-    assert_both(graph, nodes, 30, "Complex Graph maximum flow should be 30")
\ No newline at end of file
+    assert_all(graph, nodes, 30, "Complex Graph maximum flow should be 30")
+
+def test_long_chain_graph():
+    # Chain deeper than the default recursion limit
+    nodes = {str(i): Node(str(i)) for i in range(5000)}
+    for i in range(4999):
+        nodes[str(i)].add_edge(nodes[str(i + 1)], 3 if i % 7 else 4)
+    nodes["0"].add_edge(nodes["4999"], 2)
+
+    graph = Graph(nodes)
+    assert graph.dinic(nodes["0"], nodes["4999"]) == 5
+    graph.reset_calculated_flows()
+    assert graph.edmonds_karp(nodes["0"], nodes["4999"]) == 5
+    graph.reset_calculated_flows()
+    assert graph.push_relabel(nodes["0"], nodes["4999"]) == 5
+
+def test_random_graphs_agree():
+    random.seed(3)
+    for size, edges in [(20, 60), (100, 1000), (300, 900)]:
+        graph = Graph.generate_random_graph(size, edges, 10)
+        source = next(iter(graph.nodes.values()))
+        sink = next(reversed(graph.nodes.values()))
+
+        expected = graph.edmonds_karp(source, sink)
+        graph.reset_calculated_flows()
+        assert graph.dinic(source, sink) == expected
+        graph.reset_calculated_flows()
+        assert graph.push_relabel(source, sink) == expected
+
+        # Push-relabel must leave a valid flow, not just a preflow
+        for node in graph.nodes.values():
+            if node is not source and node is not sink:
+                assert sum(edge.flow for edge in node.edges) == 0
+
+def test_incremental_capacity_updates():
+    nodes = {name: Node(name) for name in ["S", "A", "B", "T"]}
+    nodes["S"].add_edge(nodes["A"], 10)
+    nodes["S"].add_edge(nodes["B"], 5)
+    nodes["A"].add_edge(nodes["T"], 10)
+    nodes["B"].add_edge(nodes["T"], 10)
+    nodes["A"].add_edge(nodes["B"], 10)
+
+    graph = Graph(nodes)
+    assert graph.dinic(nodes["S"], nodes["T"]) == 15
+    s_to_a, a_to_t = nodes["S"].edges[0], nodes["A"].edges[1]
+
+    # Decrease that can be rerouted through A -> B -> T
+    assert graph.update_capacity(a_to_t, 5, nodes["S"], nodes["T"]) == 15
+    # Decrease that lowers the flow
+    assert graph.update_capacity(s_to_a, 2, nodes["S"], nodes["T"]) == 7
+    # Increases augment from the stored flow
+    assert graph.update_capacities([(s_to_a, 20), (a_to_t, 20)], nodes["S"], nodes["T"]) == 25
+
+def test_incremental_matches_full_solve():
+    random.seed(11)
+    graph = Graph.generate_random_graph(60, 200, 10)
+    source = next(iter(graph.nodes.values()))
+    sink = next(reversed(graph.nodes.values()))
+    edges = [edge for node in graph.nodes.values() for edge in node.edges]
+    graph.dinic(source, sink)
+
+    for _ in range(30):
+        changes = {random.choice(edges): random.randint(0, 12) for _ in range(3)}
+        value = graph.update_capacities(changes.items(), source, sink)
+        for node in graph.nodes.values():
+            assert all(edge.flow <= edge.capacity for edge in node.edges)
+
+        graph.reset_calculated_flows()
+        assert value == graph.dinic(source, sink)
+
+def test_min_cut():
+    nodes = {name: Node(name) for name in ["S", "A", "B", "T"]}
+    nodes["S"].add_edge(nodes["A"], 10)
+    nodes["S"].add_edge(nodes["B"], 5)
+    nodes["A"].add_edge(nodes["B"], 15)
+    nodes["A"].add_edge(nodes["T"], 4)
+    nodes["B"].add_edge(nodes["T"], 6)
+
+    graph = Graph(nodes)
+    with pytest.raises(ValueError):
+        graph.min_cut(nodes["S"], nodes["T"])
+
+    max_flow = graph.dinic(nodes["S"], nodes["T"])
+    assert graph.level_source is nodes["S"]  # The final BFS is reused
+    cut = graph.min_cut(nodes["S"], nodes["T"])
+    assert cut.capacity == max_flow == 10
+    assert cut.source_side == {nodes["S"], nodes["A"], nodes["B"]}
+    assert all(edge.flow == edge.capacity for edge in cut.edges)
+
+    graph.reset_calculated_flows()
+    graph.edmonds_karp(nodes["S"], nodes["T"])
+    assert graph.min_cut(nodes["S"], nodes["T"]).capacity == 10
+
+def test_min_cut_after_edge_changes():
+    def build():
+        nodes = {name: Node(name) for name in ["S", "A", "T"]}
+        graph = Graph(nodes, directed=True)
+        graph.add_edge(nodes["S"], nodes["A"], 3)
+        graph.add_edge(nodes["A"], nodes["T"], 2)
+        assert graph.dinic(nodes["S"], nodes["T"]) == 2
+        return graph, nodes
+
+    graph, nodes = build()
+    graph.add_edge(nodes["S"], nodes["T"], 5)  # The stored flow is no longer maximum
+    with pytest.raises(ValueError):
+        graph.min_cut(nodes["S"], nodes["T"])
+
+    graph, nodes = build()
+    nodes["S"].add_edge(nodes["T"], 5, directed=True)
+    with pytest.raises(ValueError):
+        graph.min_cut(nodes["S"], nodes["T"])
+    graph.dinic(nodes["S"], nodes["T"])
+    assert graph.min_cut(nodes["S"], nodes["T"]).capacity == 7
+
+def test_directed_edges():
+    # B -> A can only be used forwards in directed mode
+    def build(directed):
+        nodes = {name: Node(name) for name in ["S", "A", "B", "T"]}
+        graph = Graph(nodes, directed)
+        graph.add_edge(nodes["S"], nodes["A"], 10)
+        graph.add_edge(nodes["B"], nodes["A"], 10)
+        graph.add_edge(nodes["S"], nodes["B"], 2)
+        graph.add_edge(nodes["A"], nodes["T"], 3)
+        graph.add_edge(nodes["B"], nodes["T"], 10)
+        return graph, nodes
+
+    graph, nodes = build(directed=False)
+    assert_all(graph, nodes, 12, "Undirected maximum flow should be 12")
+    graph, nodes = build(directed=True)
+    assert_all(graph, nodes, 5, "Directed maximum flow should be 5")
+    assert nodes["A"].edges[0].capacity == 0  # Reverse residual edge of S -> A
+
+def test_random_directed_graphs_agree():
+    random.seed(4)
+    for size, edges in [(20, 60), (200, 800)]:
+        graph = Graph.generate_random_graph(size, edges, 10, directed=True)
+        source = next(iter(graph.nodes.values()))
+        sink = next(reversed(graph.nodes.values()))
+
+        expected = graph.edmonds_karp(source, sink)
+        graph.reset_calculated_flows()
+        assert graph.dinic(source, sink) == expected
+        graph.reset_calculated_flows()
+        assert graph.push_relabel(source, sink) == expected
+        assert graph.min_cut(source, sink).capacity == expected
+
+def test_push_relabel_activates_above_highest():
+    # N5 is relabeled above the highest active label, pushes to N2, then drops out in a gap
+    nodes = {f"N{i}": Node(f"N{i}") for i in range(7)}
+    graph = Graph(nodes)
+    for u, v, capacity in [(0, 5, 1e6), (5, 6, 10), (5, 2, 5), (2, 3, 1), (3, 6, 1e6)]:
+        graph.add_edge(nodes[f"N{u}"], nodes[f"N{v}"], capacity)
+    assert graph.push_relabel(nodes["N0"], nodes["N6"]) == 11
+    assert graph.min_cut(nodes["N0"], nodes["N6"]).capacity == 11
+
+def test_push_relabel_float_capacities():
+    # 0.1 + 0.2 leaves rounding excess on the dead end A, which has no residual edge left
+    nodes = {name: Node(name) for name in ["S", "A", "T"]}
+    graph = Graph(nodes, directed=True)
+    graph.add_edge(nodes["S"], nodes["A"], 0.1)
+    graph.add_edge(nodes["S"], nodes["A"], 0.2)
+    graph.add_edge(nodes["T"], nodes["S"], 1)
+    assert graph.push_relabel(nodes["S"], nodes["T"]) == 0
+
+    random.seed(28)
+    for directed in (False, True):
+        for size in [10, 60]:
+            tails, heads, _ = generate_random_edges(size, size * 3)
+            nodes = {f"Node{i}": Node(f"Node{i}") for i in range(size)}
+            graph = Graph(nodes, directed)
+            for u, v in zip(tails, heads):
+                graph.add_edge(nodes[f"Node{u}"], nodes[f"Node{v}"], random.random() * 3)
+            source, sink = random.sample(list(nodes.values()), 2)
+            expected = graph.dinic(source, sink)
+            graph.reset_calculated_flows()
+            assert graph.push_relabel(source, sink) == pytest.approx(expected)
+            assert graph.flow_value(source) == pytest.approx(expected)
+
+def test_solver_observer_events():
+    class Recorder(SolverObserver):
+        def __init__(self):
+            self.events = []
+
+        def phase_started(self, graph, phase):
+            self.events.append(("start", phase))
+
+        def level_graph_built(self, graph, level):
+            self.events.append(("level", level[nodes["T"]]))
+
+        def path_augmented(self, graph, flow, path):
+            self.events.append(("path", flow, [node.name for node in path]))
+
+        def phase_finished(self, graph, phase, max_flow):
+            self.events.append(("finish", phase, max_flow))
+
+    nodes = {name: Node(name) for name in ["S", "A", "B", "T"]}
+    nodes["S"].add_edge(nodes["A"], 10, directed=True)
+    nodes["S"].add_edge(nodes["B"], 5, directed=True)
+    nodes["A"].add_edge(nodes["T"], 10, directed=True)
+    nodes["B"].add_edge(nodes["T"], 10, directed=True)
+    graph = Graph(nodes)
+
+    recorder = Recorder()
+    assert graph.dinic(nodes["S"], nodes["T"], recorder) == 15
+    assert recorder.events == [("start", 1), ("level", 2),
+                               ("path", 10, ["S", "A", "T"]), ("path", 5, ["S", "B", "T"]),
+                               ("finish", 1, 15)]
+
+    graph.reset_calculated_flows()
+    recorder = Recorder()
+    assert graph.edmonds_karp(nodes["S"], nodes["T"], recorder) == 15
+    assert recorder.events == [("start", 1), ("path", 10, ["S", "A", "T"]), ("finish", 1, 10),
+                               ("start", 2), ("path", 5, ["S", "B", "T"]), ("finish", 2, 15)]
+
+def test_demo_printers(capsys):
+    nodes = {name: Node(name) for name in ["S", "A", "T"]}
+    nodes["S"].add_edge(nodes["A"], 4)
+    nodes["A"].add_edge(nodes["T"], 3)
+    graph = Graph(nodes)
+
+    assert graph.dinic_demo(nodes["S"], nodes["T"]) == 3
+    assert capsys.readouterr().out.splitlines() == [
+        "Step 1", "Level Graph {S: 0, A: 1, T: 2}", " Found Flow 3 [S, A, T]",
+        " Stopping Flow reached, new max flow: 3"]
+
+    graph.reset_calculated_flows()
+    assert graph.edmonds_karp(nodes["S"], nodes["T"], EdmondsKarpPrinter(plot=False)) == 3
+    output = capsys.readouterr().out
+    assert "Augmenting Path: S -> A -> T" in output and "A -> T | Capacity: 3, Flow: 3" in output
+
+def test_profile_stats():
+    nodes = {name: Node(name) for name in ["S", "A", "B", "T"]}
+    nodes["S"].add_edge(nodes["A"], 10, directed=True)
+    nodes["S"].add_edge(nodes["B"], 5, directed=True)
+    nodes["A"].add_edge(nodes["B"], 15, directed=True)
+    nodes["A"].add_edge(nodes["T"], 4, directed=True)
+    nodes["B"].add_edge(nodes["T"], 6, directed=True)
+    graph = Graph(nodes)
+
+    max_flow, stats = graph.profile("dinic", nodes["S"], nodes["T"])
+    assert max_flow == stats.max_flow == 10
+    assert stats.phases == len(stats.phase_times) == 2
+    assert stats.augmentations == 3
+    assert stats.max_level == 3
+    assert stats.peak_memory > 0
+    # Per phase, BFS over every reached node's edges, then each DFS step's edges including
+    # the one stepped along and current arcs re-examined after augmenting; last failing BFS
+    assert stats.arc_scans == (10 + 10) + (10 + 9) + 8
+
+    graph.reset_calculated_flows()
+    max_flow, stats = graph.profile("edmonds_karp", nodes["S"], nodes["T"], trace_memory=False)
+    exported = stats.as_dict()
+    assert exported["max_flow"] == 10 and exported["phases"] == exported["augmentations"] == 3
+    # Edges scanned per BFS: S, A (until A -> T) / S, A, B / S, A, S again, B / S, A, S, B
+    assert exported["arc_scans"] == (2 + 3) + (2 + 3 + 3) + (2 + 3 + 2 + 3) + (2 + 3 + 2 + 3)
+    assert exported["peak_memory"] == 0
+
+    with pytest.raises(ValueError):
+        graph.profile("push_relabel", nodes["S"], nodes["T"])
+
+def test_threshold_queries():
+    random.seed(21)
+    graph = Graph.generate_random_graph(200, 600, 10)
+    source = next(iter(graph.nodes.values()))
+    sink = next(reversed(graph.nodes.values()))
+    expected = graph.dinic(source, sink)
+
+    for amount in [1, expected // 2, expected]:
+        graph.reset_calculated_flows()
+        assert graph.flow_at_least(source, sink, amount)
+        assert graph.flow_value(source) == amount
+    graph.reset_calculated_flows()
+    assert not graph.flow_at_least(source, sink, expected + 1)
+    assert graph.flow_value(source) == expected
+
+    graph.reset_calculated_flows()
+    assert graph.edmonds_karp(source, sink, limit=3) == 3
+    assert graph.edmonds_karp(source, sink) == expected - 3
+
+def test_bounded_dinic():
+    random.seed(22)
+    graph = Graph.generate_random_graph(300, 900, 10)
+    source = next(iter(graph.nodes.values()))
+    sink = next(reversed(graph.nodes.values()))
+    expected = graph.dinic(source, sink)
+
+    graph.reset_calculated_flows()
+    result = graph.bounded_dinic(source, sink, max_phases=1)
+    assert result.phases == 1
+    assert result.flow == graph.flow_value(source) <= expected <= result.upper_bound
+
+    result = graph.bounded_dinic(source, sink, time_limit=0)  # Continues from the current flow
+    assert result.phases == 0 and result.flow <= expected <= result.upper_bound
+
+    result = graph.bounded_dinic(source, sink)
+    assert result.optimal and result.flow == result.upper_bound == expected
+    assert graph.min_cut(source, sink).capacity == expected
+
+    graph.reset_calculated_flows()
+    result = graph.bounded_dinic(source, sink, target=expected // 2)
+    assert result.flow == expected // 2 and not result.optimal
+
+def test_multi_terminal_flow():
+    nodes = {name: Node(name) for name in ["S1", "S2", "A", "B", "T1", "T2"]}
+    graph = Graph(nodes, directed=True)
+    graph.add_edge(nodes["S1"], nodes["A"], 5)
+    graph.add_edge(nodes["S2"], nodes["A"], 4)
+    graph.add_edge(nodes["S2"], nodes["B"], 3)
+    graph.add_edge(nodes["A"], nodes["T1"], 6)
+    graph.add_edge(nodes["A"], nodes["B"], 2)
+    graph.add_edge(nodes["B"], nodes["T2"], 4)
+    degrees = {name: len(node.edges) for name, node in nodes.items()}
+
+    sources, sinks = [nodes["S1"], nodes["S2"]], [nodes["T1"], nodes["T2"]]
+    assert graph.multi_terminal_flow(sources, sinks) == 10
+    assert {name: len(node.edges) for name, node in nodes.items()} == degrees
+    assert sum(edge.flow for source in sources for edge in source.edges) == 10
+    for name in ["A", "B"]:
+        assert sum(edge.flow for edge in nodes[name].edges) == 0
+    assert all(edge.flow <= edge.capacity for node in nodes.values() for edge in node.edges)
+
+    supplies = {nodes["S1"]: 1, nodes["S2"]: 10}
+    assert graph.multi_terminal_flow(supplies, {nodes["T1"]: 6, nodes["T2"]: 2}) == 7
+    assert sum(edge.flow for edge in nodes["S1"].edges) == 1
+
+    with pytest.raises(ValueError):
+        graph.multi_terminal_flow([nodes["S1"], nodes["A"]], [nodes["A"]])
+
+def test_multi_terminal_matches_super_nodes():
+    random.seed(23)
+    for _ in range(20):
+        graph = Graph.generate_random_graph(40, 120, 10, directed=True)
+        chosen = random.sample(list(graph.nodes.values()), 6)
+        sources, sinks = chosen[:3], chosen[3:]
+        result = graph.multi_terminal_flow(sources, sinks)
+
+        super_source, super_sink = Node("S*"), Node("T*")
+        for node in sources:
+            super_source.add_edge(node, 1000, directed=True)
+        for node in sinks:
+            node.add_edge(super_sink, 1000, directed=True)
+        graph.nodes.update({"S*": super_source, "T*": super_sink})
+        graph.reset_calculated_flows()
+        assert graph.dinic(super_source, super_sink) == result
+
+def test_min_cost_max_flow():
+    nodes = {name: Node(name) for name in ["S", "A", "B", "T"]}
+    graph = Graph(nodes, directed=True)
+    graph.add_edge(nodes["S"], nodes["A"], 4, cost=1)
+    graph.add_edge(nodes["S"], nodes["B"], 2, cost=5)
+    graph.add_edge(nodes["A"], nodes["B"], 3, cost=1)
+    graph.add_edge(nodes["A"], nodes["T"], 2, cost=6)
+    graph.add_edge(nodes["B"], nodes["T"], 4, cost=1)
+
+    # Every source and sink edge saturates, so A -> B carries 2: 4 + 10 + 2 + 12 + 4
+    assert graph.min_cost_max_flow(nodes["S"], nodes["T"]) == (6, 32)
+    assert graph.flow_cost() == 32
+    assert graph.min_cost_max_flow(nodes["S"], nodes["T"], limit=3) == (3, 9)
+
+    with pytest.raises(ValueError):
+        nodes["S"].add_edge(nodes["T"], 1, cost=2)
+
+def assert_no_negative_cycle(graph):
+    # Bellman-Ford from a virtual root over the residual graph
+    distance = dict.fromkeys(graph.nodes.values(), 0)
+    for _ in range(len(distance)):
+        changed = False
+        for node in graph.nodes.values():
+            for edge in node.edges:
+                if edge.capacity - edge.flow > 0 and distance[node] + edge.cost < distance[edge.target]:
+                    distance[edge.target] = distance[node] + edge.cost
+                    changed = True
+        if not changed:
+            return
+    raise AssertionError("Residual graph has a negative-cost cycle")
+
+def test_random_min_cost_flows_are_optimal():
+    random.seed(24)
+    for _ in range(30):
+        nodes = [Node(f"Node{i}") for i in range(12)]
+        graph = Graph({node.name: node for node in nodes}, directed=True)
+        for _ in range(40):
+            u, v = random.sample(nodes, 2)
+            graph.add_edge(u, v, random.randint(1, 10), cost=random.randint(-1, 10))
+        try:
+            flow, cost = graph.min_cost_max_flow(nodes[0], nodes[-1])
+        except ValueError:  # Negative-cost cycle in the input
+            continue
+        assert cost == graph.flow_cost()
+        assert_no_negative_cycle(graph)
+        expected = graph.dinic(nodes[0], nodes[-1])  # Augments from the min-cost flow
+        assert expected == 0 and graph.flow_value(nodes[0]) == flow
+
+def test_capacity_scaling_wide_range():
+    random.seed(25)
+    graph = Graph.generate_random_graph(300, 900, 10 ** 6)
+    source = next(iter(graph.nodes.values()))
+    sink = next(reversed(graph.nodes.values()))
+    widest = min(max(edge.capacity for edge in source.edges), max(edge.reverse.capacity for edge in sink.edges))
+    thresholds = list(graph.scaling_thresholds(source, sink))
+    assert thresholds[0] < widest <= 2 * thresholds[0] and thresholds[-2:] == [1, 0]
+    expected = graph.dinic(source, sink)
+    for solver in ["edmonds_karp_scaling", "dinic_scaling"]:
+        graph.reset_calculated_flows()
+        assert getattr(graph, solver)(source, sink) == expected
+        assert graph.min_cut(source, sink).capacity == expected
+
+    graph.reset_calculated_flows()
+    assert graph.edmonds_karp(source, sink, threshold=10 ** 6) == 0  # No residual edge exceeds it
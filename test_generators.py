@@ -0,0 +1,48 @@
+from .graph import Graph, generate_random_edges
+from .generators import random_csr, grid_graph, layered_graph, bipartite_graph, staircase_graph
+import pytest
+
+
+def terminals(graph):
+    return next(iter(graph.nodes.values())), next(reversed(graph.nodes.values()))
+
+
+def test_random_edges_are_seeded_and_simple():
+    for num_nodes, num_edges in [(50, 49), (50, 200), (50, 1200), (50, 1225)]:
+        tails, heads, capacities = generate_random_edges(num_nodes, num_edges, 10, seed=3)
+        assert (tails, heads, capacities) == generate_random_edges(num_nodes, num_edges, 10, seed=3)
+        pairs = {frozenset(pair) for pair in zip(tails, heads)}
+        assert len(pairs) == num_edges and all(len(pair) == 2 for pair in pairs)
+        assert all(1 <= capacity <= 10 for capacity in capacities)
+
+    with pytest.raises(ValueError):
+        generate_random_edges(50, 1226)
+    with pytest.raises(ValueError):
+        generate_random_edges(50, 48)
+
+
+def test_random_csr_matches_graph():
+    graph = Graph.generate_random_graph(300, 900, 10, seed=8)
+    csr = random_csr(300, 900, 10, seed=8)
+    source, sink = terminals(graph)
+    assert csr.dinic(source, sink) == graph.dinic(source, sink)
+
+
+def test_families():
+    graph = grid_graph(4, 6, seed=1)
+    source, sink = terminals(graph)
+    expected = graph.edmonds_karp(source, sink)
+    graph.reset_calculated_flows()
+    assert graph.dinic(source, sink) == expected > 0
+
+    graph = layered_graph(5, 8, seed=1)
+    source, sink = terminals(graph)
+    assert graph.dinic(source, sink) == graph.min_cut(source, sink).capacity > 0
+
+    graph = bipartite_graph(10, 10, 10 * 10)
+    source, sink = terminals(graph)
+    assert graph.dinic(source, sink) == 10
+
+    graph = staircase_graph(50)
+    source, sink = terminals(graph)
+    assert graph.push_relabel(source, sink) == 50
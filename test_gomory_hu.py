@@ -0,0 +1,39 @@
+from .graph import Node, Graph
+from .gomory_hu import GomoryHuTree
+import pytest
+import random
+
+
+def test_matches_pairwise_dinic():
+    random.seed(5)
+    for size, edges in [(2, 1), (8, 12), (25, 60)]:
+        graph = Graph.generate_random_graph(size, edges, 10)
+        tree = GomoryHuTree(graph)
+        nodes = list(graph.nodes.values())
+        assert len(tree.edges()) == size - 1
+
+        for source in nodes:
+            for sink in nodes:
+                if source is sink:
+                    continue
+                graph.reset_calculated_flows()
+                assert tree.max_flow(source, sink) == graph.dinic(source, sink)
+
+
+def test_path_minimum():
+    # A path graph is its own tree
+    nodes = {str(i): Node(str(i)) for i in range(6)}
+    capacities = [7, 3, 9, 4, 8]
+    for i, capacity in enumerate(capacities):
+        nodes[str(i)].add_edge(nodes[str(i + 1)], capacity)
+
+    tree = GomoryHuTree(Graph(nodes))
+    assert tree.max_flow(nodes["0"], nodes["5"]) == 3
+    assert tree.max_flow(nodes["2"], nodes["5"]) == 4
+    assert tree.max_flow(nodes["5"], nodes["4"]) == 8
+
+
+def test_rejects_directed_graph():
+    graph = Graph.generate_random_graph(5, 6, directed=True)
+    with pytest.raises(ValueError):
+        GomoryHuTree(graph)
@@ -0,0 +1,84 @@
+from .graph import Node, Graph
+from .generators import random_csr
+from .graph_io import read_dimacs, read_edge_list, write_dimacs, write_edge_list
+import pytest
+import random
+
+
+DIMACS = """c small example
+p max 4 5
+n 1 s
+n 4 t
+a 1 2 10
+a 1 3 5
+a 2 3 15
+a 2 4 5
+a 3 4 10
+"""
+
+
+def test_read_dimacs(tmp_path):
+    path = tmp_path / "small.max"
+    path.write_text(DIMACS)
+    for chunk_size in [7, 1 << 20]:  # Lines split across chunk boundaries
+        csr, source, sink = read_dimacs(str(path), chunk_size=chunk_size)
+        assert (csr.num_nodes, source, sink) == (4, 0, 3)
+        assert csr.dinic(source, sink) == 15
+
+    csr, source, sink = read_dimacs(str(path), directed=False)
+    assert csr.dinic(source, sink) == 15
+
+
+def test_read_dimacs_rejects_other_problems(tmp_path):
+    path = tmp_path / "min.max"
+    path.write_text("p min 2 1\nn 1 s\nn 2 t\na 1 2 3\n")
+    with pytest.raises(ValueError):
+        read_dimacs(str(path))
+
+
+def test_dimacs_round_trip(tmp_path):
+    random.seed(3)
+    graph = Graph.generate_random_graph(60, 200, 10)
+    source = next(iter(graph.nodes.values()))
+    sink = next(reversed(graph.nodes.values()))
+    path = str(tmp_path / "random.max")
+    write_dimacs(graph, path, source, sink)
+
+    csr, s, t = read_dimacs(path, chunk_size=64)
+    assert csr.dinic(s, t) == graph.dinic(source, sink)
+
+    write_dimacs(csr, path, s, t)
+    again, s, t = read_dimacs(path)
+    arcs = lambda g: sorted((u, g.heads[a], g.capacity[a]) for u in range(g.num_nodes)
+                            for a in range(g.offsets[u], g.offsets[u + 1]) if g.capacity[a] > 0)
+    assert arcs(again) == arcs(csr)
+
+
+def test_edge_list_round_trip(tmp_path):
+    nodes = {name: Node(name) for name in ["S", "A", "B", "T"]}
+    graph = Graph(nodes, directed=True)
+    graph.add_edge(nodes["S"], nodes["A"], 4)
+    graph.add_edge(nodes["S"], nodes["B"], 2.5)
+    graph.add_edge(nodes["A"], nodes["B"], 3)
+    graph.add_edge(nodes["A"], nodes["T"], 1)
+    graph.add_edge(nodes["B"], nodes["T"], 6)
+    path = str(tmp_path / "edges.csv")
+    write_edge_list(graph, path)
+
+    csr = read_edge_list(path, chunk_size=16)
+    assert csr.names == ["S", "A", "B", "T"]
+    assert csr.dinic("S", "T") == graph.dinic(nodes["S"], nodes["T"]) == 6.5
+    copy = csr.to_graph(directed=True)
+    assert sorted((e.target.name, e.capacity) for e in copy.nodes["A"].edges if e.capacity > 0) == \
+           [("B", 3), ("T", 1)]
+
+
+def test_write_undirected_csr(tmp_path):
+    csr = random_csr(100, 300, seed=5)
+    expected = csr.dinic(0, 99)
+    csr.reset_calculated_flows()
+    path = str(tmp_path / "random.csv")
+    write_edge_list(csr, path)
+
+    copy = read_edge_list(path)
+    assert copy.dinic("Node0", "Node99") == expected
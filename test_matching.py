@@ -0,0 +1,38 @@
+from .generators import bipartite_graph
+from .matching import hopcroft_karp, matching_from_graph
+import random
+
+
+def assert_valid(matching, adjacency):
+    assert len(set(matching.pairs.values())) == matching.size
+    assert all(v in adjacency[u] for u, v in matching.pairs.items())
+    # The cover touches every edge and has the size of the matching (König)
+    assert all(u in matching.left_cover or v in matching.right_cover for u in adjacency for v in adjacency[u])
+    assert len(matching.left_cover) + len(matching.right_cover) == matching.size
+
+
+def test_small_matching():
+    adjacency = {"a": ["x", "y"], "b": ["x"], "c": ["x"], "d": ["y", "z"]}
+    matching = hopcroft_karp("abcd", "xyz", adjacency)
+    assert matching.size == 3
+    assert_valid(matching, adjacency)
+
+    assert hopcroft_karp([], ["x"], {}).size == 0
+    assert hopcroft_karp(["a"], ["x"], {}).left_cover == set()
+
+
+def test_matches_dinic_on_bipartite_graphs():
+    random.seed(26)
+    for seed in range(15):
+        left, right = random.randint(1, 60), random.randint(1, 60)
+        graph = bipartite_graph(left, right, random.randint(0, left * right // 4), seed=seed)
+        source, sink = graph.nodes["S"], graph.nodes["T"]
+
+        matching = matching_from_graph(graph, source, sink)
+        assert matching.size == graph.dinic(source, sink)
+        adjacency = {edge.target: [e.target for e in edge.target.edges if e.capacity > 0 and e.target is not source]
+                     for edge in source.edges}
+        assert_valid(matching, adjacency)
+
+        cut = graph.min_cut(source, sink)  # Every cover has at least max-flow vertices
+        assert len(matching.left_cover) + len(matching.right_cover) == cut.capacity
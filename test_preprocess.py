@@ -0,0 +1,91 @@
+from .graph import Node, Graph, generate_random_edges
+from .preprocess import reduce_graph
+import pytest
+import random
+
+
+def assert_valid_flow(graph, source, sink, value):
+    for node in graph.nodes.values():
+        for edge in node.edges:
+            assert edge.flow <= edge.capacity and edge.flow == -edge.reverse.flow
+        if node is not source and node is not sink:
+            assert sum(edge.flow for edge in node.edges) == pytest.approx(0)
+    assert graph.flow_value(source) == value
+
+
+def test_chain_parallel_and_dead_ends():
+    nodes = {name: Node(name) for name in ["S", "A", "B", "C", "D", "X", "T"]}
+    graph = Graph(nodes, directed=True)
+    graph.add_edge(nodes["S"], nodes["A"], 5)
+    graph.add_edge(nodes["A"], nodes["B"], 3)  # S-A-B-C-T chain, bottleneck 3
+    graph.add_edge(nodes["B"], nodes["C"], 4)
+    graph.add_edge(nodes["C"], nodes["T"], 6)
+    graph.add_edge(nodes["S"], nodes["T"], 1)  # Parallel to the contracted chain
+    graph.add_edge(nodes["S"], nodes["D"], 2)
+    graph.add_edge(nodes["D"], nodes["T"], 2)
+    graph.add_edge(nodes["A"], nodes["X"], 9)  # Dead end
+
+    reduction = reduce_graph(graph, nodes["S"], nodes["T"])
+    assert list(reduction.graph.nodes) == ["S", "T"]
+    assert [edge.capacity for edge in reduction.graph.nodes["S"].edges] == [6]
+    assert reduction.solve() == 6
+    assert_valid_flow(graph, nodes["S"], nodes["T"], 6)
+    assert nodes["A"].edges[-1].flow == 0  # A -> X
+    assert graph.min_cut(nodes["S"], nodes["T"]).capacity == 6
+
+
+def test_unreachable_nodes_are_dropped():
+    nodes = {name: Node(name) for name in ["S", "A", "B", "C", "T"]}
+    graph = Graph(nodes, directed=True)
+    graph.add_edge(nodes["S"], nodes["A"], 2)
+    graph.add_edge(nodes["S"], nodes["B"], 2)
+    graph.add_edge(nodes["A"], nodes["T"], 2)
+    graph.add_edge(nodes["B"], nodes["T"], 2)
+    graph.add_edge(nodes["A"], nodes["B"], 2)
+    graph.add_edge(nodes["C"], nodes["A"], 7)  # C is not reachable from S
+
+    reduction = reduce_graph(graph, nodes["S"], nodes["T"])
+    assert "C" not in reduction.graph.nodes
+    assert nodes["C"] not in reduction.node_map
+    assert reduction.solve("push_relabel") == 4
+
+
+def test_random_graphs_agree():
+    random.seed(17)
+    for directed in (False, True):
+        for floats in (False, True):
+            for _ in range(60):
+                size = random.randint(2, 25)
+                num_edges = random.randint(size - 1, min(2 * size, size * (size - 1) // 2))
+                if floats:  # Splitting float flows over parallel edges must not leave rounding residuals
+                    graph = Graph({f"Node{i}": Node(f"Node{i}") for i in range(size)}, directed)
+                    nodes = list(graph.nodes.values())
+                    for u, v, _ in zip(*generate_random_edges(size, num_edges)):
+                        graph.add_edge(nodes[u], nodes[v], round(random.random() * 10, 3))
+                else:
+                    graph = Graph.generate_random_graph(size, num_edges, 10, directed=directed)
+                source, sink = random.sample(list(graph.nodes.values()), 2)
+                expected = graph.dinic(source, sink)
+
+                reduction = reduce_graph(graph, source, sink)
+                assert len(reduction.graph.nodes) <= size
+                assert reduction.solve("edmonds_karp") == pytest.approx(expected)
+                assert_valid_flow(graph, source, sink, pytest.approx(expected))
+                assert graph.min_cut(source, sink).capacity == pytest.approx(expected)
+
+
+def test_sparse_graph_shrinks():
+    graph = Graph.generate_random_graph(2000, 2100, 10, seed=3)
+    nodes = list(graph.nodes.values())
+    reduction = reduce_graph(graph, nodes[0], nodes[-1])
+    assert len(reduction.graph.nodes) * 4 < len(nodes)
+    assert reduction.solve() == graph.query(nodes[0], nodes[-1])
+
+
+def test_rejects_edge_costs():
+    nodes = {name: Node(name) for name in ["S", "A", "T"]}
+    graph = Graph(nodes, directed=True)
+    graph.add_edge(nodes["S"], nodes["A"], 2, cost=3)
+    graph.add_edge(nodes["A"], nodes["T"], 2)
+    with pytest.raises(ValueError):
+        reduce_graph(graph, nodes["S"], nodes["T"])
@@ -0,0 +1,67 @@
+from .graph import Node, Graph
+from .service import FlowService, LocalClient
+import asyncio
+import pytest
+import random
+
+
+def build_graph():
+    nodes = {name: Node(name) for name in ["S", "A", "B", "T"]}
+    graph = Graph(nodes, directed=True)
+    graph.add_edge(nodes["S"], nodes["A"], 4)
+    graph.add_edge(nodes["S"], nodes["B"], 3)
+    graph.add_edge(nodes["A"], nodes["B"], 2)
+    graph.add_edge(nodes["A"], nodes["T"], 1)
+    graph.add_edge(nodes["B"], nodes["T"], 6)
+    return graph, nodes
+
+
+def test_batched_and_coalesced_queries():
+    random.seed(5)
+    graph = Graph.generate_random_graph(200, 600, 10)
+    nodes = list(graph.nodes.values())
+    sinks = [nodes[i] for i in range(1, 200, 20)]
+    expected = [graph.query(nodes[0], sink) for sink in sinks]
+
+    async def run():
+        async with FlowService(batch_window=0.01) as service:
+            service.register("random", graph)
+            queries = [service.max_flow("random", "Node0", sink.name) for sink in sinks]
+            queries += [service.max_flow("random", nodes[0], sinks[0]) for _ in range(5)]
+            return await asyncio.gather(*queries), service.stats.as_dict()
+
+    results, stats = asyncio.run(run())
+    assert results == expected + [expected[0]] * 5
+    assert stats["submitted"] == 15 and stats["completed"] == 15
+    assert stats["coalesced"] == 5
+    assert stats["batches"] == 1
+    assert stats["queue_depth"] == 0 and stats["latency_max"] > 0
+    assert all(edge.flow == 0 for node in nodes for edge in node.edges)
+
+
+def test_min_cut_and_graph_updates():
+    graph, nodes = build_graph()
+
+    async def run():
+        async with FlowService(batch_window=0) as service:
+            service.register("small", graph)
+            cut = await service.min_cut("small", "S", "T")
+            graph.update_capacity(nodes["A"].edges[-1], 3, nodes["S"], nodes["T"])  # A -> T
+            return cut, await service.max_flow("small", "S", "T")
+
+    cut, updated = asyncio.run(run())
+    assert cut.capacity == 6
+    assert {node.name for node in cut.source_side} == {"S", "A"}
+    assert {(edge.reverse.target.name, edge.target.name) for edge in cut.edges} == {("S", "B"), ("A", "B"), ("A", "T")}
+    assert updated == 7
+
+
+def test_local_client():
+    graph, nodes = build_graph()
+    with LocalClient() as client:
+        client.register("small", graph)
+        assert client.max_flow("small", "S", "T") == 6
+        assert client.min_cut("small", "S", "B").capacity == 5
+        with pytest.raises(KeyError):
+            client.max_flow("small", "S", "missing")
+        assert client.stats()["completed"] == 2
@@ -0,0 +1,70 @@
+from .graph import Graph
+from .csr import CSRGraph
+from .generators import grid_graph, random_csr
+from .snapshot import save_snapshot, load_snapshot, load_graph
+import pytest
+
+
+def test_graph_round_trip(tmp_path):
+    graph = grid_graph(5, 7, directed=True, seed=2)
+    source, sink = graph.nodes["S"], graph.nodes["T"]
+    expected = graph.dinic(source, sink)
+    path = str(tmp_path / "grid.snap")
+    save_snapshot(graph, path, flows=True)
+
+    copy = load_graph(path)
+    assert copy.directed
+    assert list(copy.nodes) == list(graph.nodes)
+    for name, node in graph.nodes.items():
+        assert [(e.target.name, e.capacity, e.flow) for e in copy.nodes[name].edges] == \
+               [(e.target.name, e.capacity, e.flow) for e in node.edges]
+    assert copy.flow_value(copy.nodes["S"]) == expected
+
+
+def test_mapped_arrays_solve(tmp_path):
+    csr = random_csr(300, 900, seed=4)
+    expected = csr.dinic(0, 299)
+    path = str(tmp_path / "random.snap")
+    save_snapshot(csr, path)
+
+    mapped = load_snapshot(path)
+    assert isinstance(mapped.heads, memoryview) and mapped.heads.readonly
+    assert mapped.names == csr.names
+    assert not any(mapped.flow)
+    assert mapped.dinic("Node0", "Node299") == expected
+    mapped.reset_calculated_flows()
+    assert mapped.edmonds_karp(0, 299) == expected
+
+
+def test_costs_round_trip(tmp_path):
+    graph = grid_graph(4, 5, directed=True, seed=6)
+    for i, (tail, edge) in enumerate(graph.edge_pairs()):
+        edge.cost, edge.reverse.cost = i % 7, -(i % 7)
+    source, sink = graph.nodes["S"], graph.nodes["T"]
+    expected = graph.min_cost_max_flow(source, sink)
+    path = str(tmp_path / "costs.snap")
+    save_snapshot(graph, path)
+
+    assert load_snapshot(path).cost is not None
+    for copy in [CSRGraph.from_graph(graph).to_graph(), load_graph(path)]:
+        assert [e.cost for node in copy.nodes.values() for e in node.edges] == \
+               [e.cost for node in graph.nodes.values() for e in node.edges]
+        assert copy.min_cost_max_flow(copy.nodes["S"], copy.nodes["T"]) == expected
+
+
+def test_unnamed_and_empty(tmp_path):
+    path = str(tmp_path / "edges.snap")
+    save_snapshot(CSRGraph.from_edges(3, [(0, 1, 4), (1, 2, 2.5)], directed=True), path)
+    mapped = load_snapshot(path)
+    assert mapped.names is None and mapped.cost is None
+    assert mapped.dinic(0, 2) == 2.5
+
+    save_snapshot(Graph({}), path)
+    assert load_snapshot(path).num_arcs == 0
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "bad.snap"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        load_snapshot(str(path))
@@ -0,0 +1,41 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import networkx as nx
+import matplotlib.pyplot as plt
+
+if TYPE_CHECKING:
+    from graph import Graph
+
+# Kept out of graph.py so that solver-only users never import networkx/matplotlib.
+
+
+def plot_graph(graph: Graph, step: int) -> None:
+    """
+    Visualizes the graph after each step of augmentation.
+    Ensures unidirectional arrows and correct flow display.
+    """
+    G = nx.DiGraph()  # Create a directed graph
+
+    # Add nodes to the graph
+    for node in graph.nodes.values():
+        G.add_node(node.name)
+
+    # Add edges with capacity and flow as labels
+    for node in graph.nodes.values():
+        for edge in node.edges:
+            if edge.capacity > 0:
+                flow_label = f"Flow: {-edge.flow}"
+                capacity_label = f"Capacity: {edge.capacity}"
+                G.add_edge(node.name, edge.target.name, label=f"{capacity_label}\n{flow_label}")
+
+    # Draw the graph with custom settings
+    pos = nx.spring_layout(G, seed=1)  # Set positions for all nodes
+    plt.figure(figsize=(8, 6))
+    nx.draw(G, pos, with_labels=True, node_size=3000, node_color="lightblue", font_size=12, font_weight="bold", arrows=True)
+
+    # Edge labels for capacity and flow
+    edge_labels = nx.get_edge_attributes(G, "label")
+    nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, font_size=10)
+
+    plt.title(f"Graph at Step {step}")
+    plt.show()